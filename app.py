@@ -7,89 +7,118 @@ Phase 1 goals:
 - Routing and navigation live here (no sidebar nav in prod).
 - Dev-only sidebar (screen jump) is enabled only when DOE_WIZARD_DEBUG=1.
 - No disk writes occur in screens; this file performs no I/O either.
+- The active screen (plus its footer nav) and the dev sidebar each run inside an
+  `st.fragment`, so widget edits rerun only that subtree; navigation still
+  triggers a full-app `st.rerun()`.
 """
 
 import os
+import sys
+import traceback
+from functools import lru_cache
+
 import streamlit as st
 
-# Screen render imports (each returns {"valid_to_proceed": bool, "payload": dict})
-from screens.session_setup import render as render_s1
-from screens.files_join_profile import render as render_s2
-from screens.roles_collapse import render as render_s3
-from screens.modeling import render as render_s4
-from screens.optimization import render as render_s5
-from screens.handoff import render as render_s6
+# Screens are resolved lazily: only the active screen's module is imported.
+from utils.router import resolve_renderer
+from utils.ui_state import ensure_defaults
 
 # Shared UI blocks
 from ui.blocks import nav_back_reset_next
 
+# st.fragment is available from Streamlit 1.37; fall back to a plain call otherwise.
+_fragment = getattr(st, "fragment", None) or (lambda fn: fn)
 
-# Ordered list of screens (title, render_fn)
-SCREENS = [
-    ("S1 — Session Setup", render_s1),
-    ("S2 — Files · Join · Profile", render_s2),
-    ("S3 — Roles & Collapse", render_s3),
-    ("S4 — Modeling", render_s4),
-    ("S5 — Optimization", render_s5),
-    ("S6 — Handoff", render_s6),
-]
-
-
-def main() -> None:
-    st.set_page_config(page_title="DOE Wizard", layout="wide")
 
-    # Initialize router position
-    if "screen_idx" not in st.session_state:
-        st.session_state.screen_idx = 0
+# Dev-only sidebar toggle, read once per script load.
+# Toggle with: $env:DOE_WIZARD_DEBUG="1"  (PowerShell)
+DEBUG = os.getenv("DOE_WIZARD_DEBUG", "0") == "1"
 
-    # ---- Apply pending reset BEFORE rendering widgets ----
-    pending = st.session_state.get("_pending_reset")
-    if pending and pending.get("idx") == st.session_state.screen_idx:
-        for k in pending.get("keys", []):
-            if k in pending.get("defaults", {}):
-                st.session_state[k] = pending["defaults"][k]
-            else:
-                # Remove so the widget re-instantiates with its default state
-                if k in st.session_state:
-                    del st.session_state[k]
-        # run once
-        del st.session_state["_pending_reset"]
 
-    # ---- Dev-only sidebar (env-gated) ----
-    # Toggle with: $env:DOE_WIZARD_DEBUG="1"  (PowerShell)
-    debug = os.getenv("DOE_WIZARD_DEBUG", "0") == "1"
-    if debug:
-        with st.sidebar:
-            st.subheader("Dev Tools")
-            st.caption("Debug sidebar active (set DOE_WIZARD_DEBUG=1 to show)")
-            st.radio(
-                "Jump to screen",
-                options=[f"{i}: {title}" for i, (title, _) in enumerate(SCREENS)],
-                index=st.session_state.screen_idx,
-                key="dev_jump_choice",
-            )
-            # Parse selected index from "i: Title"
-            try:
-                chosen_prefix = str(st.session_state.dev_jump_choice).split(":")[0].strip()
-                new_idx = int(chosen_prefix)
-                if new_idx != st.session_state.screen_idx:
-                    st.session_state.screen_idx = new_idx
-                    st.rerun()
-            except Exception:
-                pass  # keep current index if parsing fails
+# Ordered list of screens (title, module_name); each module's render() returns
+# {"valid_to_proceed": bool, "payload": dict}
+SCREENS = [
+    ("S1 — Session Setup", "screens.session_setup"),
+    ("S2 — Files · Join · Profile", "screens.files_join_profile"),
+    ("S3 — Roles & Collapse", "screens.roles_collapse"),
+    ("S4 — Modeling", "screens.modeling"),
+    ("S5 — Optimization", "screens.optimization"),
+    ("S6 — Handoff", "screens.handoff"),
+]
 
-    # ---- Render current screen ----
-    title, renderer = SCREENS[st.session_state.screen_idx]
+# Dev-sidebar radio labels and their reverse lookup, built once at import.
+_DEV_OPTIONS = tuple(f"{i}: {title}" for i, (title, _) in enumerate(SCREENS))
+_DEV_IDX = {opt: i for i, opt in enumerate(_DEV_OPTIONS)}
+
+
+@lru_cache(maxsize=1)
+def get_pages() -> list:
+    """(key, title, module_name) triples in screen order, built in one pass.
+
+    Memoized: SCREENS is constant, so callers share one list (treat as read-only).
+    """
+    return [(module_name.rsplit(".", 1)[-1], title, module_name) for title, module_name in SCREENS]
+
+
+@_fragment
+def _dev_sidebar() -> None:
+    """Dev-only screen jump; radio edits rerun this fragment, not the whole app."""
+    st.subheader("Dev Tools")
+    st.caption("Debug sidebar active (set DOE_WIZARD_DEBUG=1 to show)")
+    st.radio(
+        "Jump to screen",
+        options=_DEV_OPTIONS,
+        index=st.session_state.screen_idx,
+        key="dev_jump_choice",
+    )
+    new_idx = _DEV_IDX.get(st.session_state.get("dev_jump_choice"))
+    if new_idx is None:
+        return  # keep current index on an unknown selection
+    if new_idx != st.session_state.screen_idx:
+        st.session_state.screen_idx = new_idx
+        st.rerun()  # full app: a different screen must render
+
+
+def _safe_render(renderer, module_name: str) -> dict:
+    """Error boundary around a screen renderer.
+
+    The happy path is a plain call. On failure the formatted traceback is kept in
+    session_state["last_error"] (formatted once per distinct error) and shown
+    collapsed, so the footer nav still renders. st.stop()/st.rerun() raise
+    BaseException subclasses and pass through untouched.
+    """
+    try:
+        return renderer() or {}
+    except Exception:
+        exc_type, exc, tb = sys.exc_info()
+        prev = st.session_state.get("last_error") or {}
+        sig = (module_name, exc_type.__name__, str(exc))
+        if prev.get("sig") != sig:
+            prev = {"sig": sig, "traceback": "".join(traceback.format_exception(exc_type, exc, tb))}
+            st.session_state["last_error"] = prev
+        st.error(f"{module_name} failed: {exc_type.__name__}: {exc}")
+        with st.expander("Traceback", expanded=False):
+            st.code(prev["traceback"], language="text")
+        return {}
+
+
+@_fragment
+def _run_screen(idx: int) -> None:
+    """Render one screen and its footer nav as an isolated fragment."""
+    title, module_name = SCREENS[idx]
     st.markdown(f"### {title}")
 
-    result = renderer() or {}
+    renderer = resolve_renderer(module_name)
+
+    result = _safe_render(renderer, module_name)
     valid = bool(result.get("valid_to_proceed", False))
 
     # ---- Footer navigation (Back / Reset / Next) ----
     back_clicked, reset_clicked, next_clicked = nav_back_reset_next(valid_to_proceed=valid)
 
-    if back_clicked and st.session_state.screen_idx > 0:
-        st.session_state.screen_idx -= 1
+    # Anything that moves screen_idx or defers a reset needs a full-app rerun.
+    if back_clicked and idx > 0:
+        st.session_state.screen_idx = idx - 1
         st.rerun()
 
     if reset_clicked:
@@ -98,16 +127,44 @@ def main() -> None:
         reset_defaults = payload.get("reset_defaults", {})
         # Defer the actual clear to the next run (pre-render)
         st.session_state["_pending_reset"] = {
-            "idx": st.session_state.screen_idx,
+            "idx": idx,
             "keys": reset_keys,
             "defaults": reset_defaults,
         }
         st.rerun()
 
-    if next_clicked and valid and st.session_state.screen_idx < len(SCREENS) - 1:
-        st.session_state.screen_idx += 1
+    if next_clicked and valid and idx < len(SCREENS) - 1:
+        st.session_state.screen_idx = idx + 1
         st.rerun()
 
 
+def main() -> None:
+    st.set_page_config(page_title="DOE Wizard", layout="wide")
+
+    # Initialize router state in one pass
+    ensure_defaults({"screen_idx": 0, "last_error": None})
+
+    # ---- Apply pending reset BEFORE rendering widgets ----
+    pending = st.session_state.get("_pending_reset")
+    if pending and pending.get("idx") == st.session_state.screen_idx:
+        for k in pending.get("keys", []):
+            if k in pending.get("defaults", {}):
+                st.session_state[k] = pending["defaults"][k]
+            else:
+                # Remove so the widget re-instantiates with its default state
+                if k in st.session_state:
+                    del st.session_state[k]
+        # run once
+        del st.session_state["_pending_reset"]
+
+    # ---- Dev-only sidebar (env-gated) ----
+    if DEBUG:
+        with st.sidebar:
+            _dev_sidebar()
+
+    # ---- Render current screen ----
+    _run_screen(st.session_state.screen_idx)
+
+
 if __name__ == "__main__":
     main()
@@ -1,12 +1,36 @@
 # app.py
+import importlib
+from functools import lru_cache
+
 import streamlit as st
 from ui.blocks import page_header, status
-from screens.session_setup import render as render_session_setup
-from screens.files_join_profile import render as render_files_join_profile
-from screens.roles_collapse import render as render_roles_collapse  # NEW
+
+# Sidebar label -> screen module; only the selected screen's module is imported.
+SCREENS = {
+    "Screen 1 — Session Setup": "screens.session_setup",
+    "Screen 2 — Files / Join / Profile": "screens.files_join_profile",
+    "Screen 3 — Roles & Collapse": "screens.roles_collapse",  # NEW
+}
+
+@lru_cache(maxsize=None)
+def _renderer(module_name: str):
+    """Import a screen module on first use and return its render()."""
+    return importlib.import_module(module_name).render
 
 st.set_page_config(page_title="CMP AI-Guided DOE Workflow (Phase-1)", layout="wide")
 
+# st.fragment is available from Streamlit 1.37; fall back to a plain call otherwise.
+_fragment = getattr(st, "fragment", None) or (lambda fn: fn)
+
+@_fragment
+def _run_screen(screen: str) -> None:
+    """Render the selected screen as a fragment: its widget edits rerun only this subtree."""
+    module_name = SCREENS.get(screen)
+    if module_name is None:
+        status("Screen not implemented yet.", "warn")
+        return
+    _renderer(module_name)()
+
 def main():
     page_header("CMP AI-Guided DOE Workflow (Phase-1)")
     st.caption("Phase-1: Session Setup → Files/Join/Profile → Roles/Collapse")
@@ -14,23 +38,12 @@ def main():
     st.sidebar.header("Navigation")
     screen = st.sidebar.radio(
         label="Go to:",
-        options=[
-            "Screen 1 — Session Setup",
-            "Screen 2 — Files / Join / Profile",
-            "Screen 3 — Roles & Collapse",  # NEW
-        ],
+        options=list(SCREENS),
         index=0,
         label_visibility="collapsed",
     )
 
-    if screen.startswith("Screen 1"):
-        render_session_setup()
-    elif screen.startswith("Screen 2"):
-        render_files_join_profile()
-    elif screen.startswith("Screen 3"):
-        render_roles_collapse()  # NEW
-    else:
-        status("Screen not implemented yet.", "warn")
+    _run_screen(screen)
 
 if __name__ == "__main__":
     main()
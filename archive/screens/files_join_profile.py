@@ -2,8 +2,8 @@
 from __future__ import annotations
 
 from pathlib import Path
+import hashlib
 import json
-from typing import Optional, Tuple, List
 
 import pandas as pd
 import streamlit as st
@@ -13,6 +13,21 @@ from services.artifacts import ARTIFACTS_DIR, write_json
 from services.session import get_active_slug
 
 MAX_PREVIEW_ROWS = 1000
+_JOIN_TYPES = ("inner", "left", "right", "outer")
+
+try:  # non-cryptographic, much faster for identity-only digests
+    import xxhash as _xxhash
+except ImportError:  # pragma: no cover
+    _xxhash = None
+
+# st.fragment is available from Streamlit 1.37; fall back to a plain call otherwise.
+_fragment = getattr(st, "fragment", None) or (lambda fn: fn)
+
+try:  # pyarrow ships with streamlit; keep the C engine as a fallback
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE = "pyarrow"
+except Exception:  # pragma: no cover
+    _CSV_ENGINE = "c"
 
 
 def _artifact(slug: str, suffix: str) -> Path:
@@ -20,34 +35,129 @@ def _artifact(slug: str, suffix: str) -> Path:
 
 
 def _read_csv(uploaded) -> pd.DataFrame:
+    if _CSV_ENGINE == "pyarrow":
+        try:
+            return pd.read_csv(uploaded, engine="pyarrow")
+        except Exception:
+            # arrow is stricter on ragged/odd files; retry with the C engine
+            if hasattr(uploaded, "seek"):
+                uploaded.seek(0)
     return pd.read_csv(uploaded)
 
 
+def _upload_meta(uploaded) -> tuple:
+    """Cheap identity for an upload: no bytes are touched (the uploader issues a new file_id on replace)."""
+    return (getattr(uploaded, "file_id", None), uploaded.name, uploaded.size)
+
+
+def _content_digest(raw: bytes | memoryview) -> str:
+    """Identity-only digest of upload bytes: xxh3_64 when available, else blake2b-64."""
+    if _xxhash is not None:
+        return _xxhash.xxh3_64_hexdigest(raw)
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+def _mark_upload_dirty(side: str) -> None:
+    """on_change for the uploaders: the next render must re-check that side's upload."""
+    st.session_state[f"s2_{side}_dirty"] = True
+
+
+def _persist_upload(uploaded, slug: str, side: str) -> Path:
+    """Write the upload once under artifacts/, named by content digest, and return its path."""
+    path_key = f"s2_{slug}_{side}_path"
+    meta_key = f"s2_{slug}_{side}_meta"
+    dirty = st.session_state.pop(f"s2_{side}_dirty", False)
+    known = st.session_state.get(path_key)
+    if known and not dirty and Path(known).exists():
+        return Path(known)  # uploader untouched since last persist
+    meta = _upload_meta(uploaded)
+    if known and st.session_state.get(meta_key) == meta and Path(known).exists():
+        return Path(known)  # same upload as last rerun: skip reading + hashing
+
+    # Zero-copy view of the upload buffer (UploadedFile is a BytesIO); released before returning
+    with (uploaded.getbuffer() if hasattr(uploaded, "getbuffer") else memoryview(uploaded.getvalue())) as raw:
+        digest = _content_digest(raw)
+        path = _artifact(slug, f"upload_{side}_{digest}.csv")
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(raw)
+    st.session_state[path_key] = str(path)
+    st.session_state[meta_key] = meta
+    return path
+
+
+# Paths embed the content digest, so caching on the path string is safe and
+# widget reruns (key/join-type changes) reuse the parse instead of re-reading.
+@st.cache_data(show_spinner=False, max_entries=4)
+def _read_csv_cached(path: str) -> pd.DataFrame:
+    return _read_csv(path)
+
+
+# Join-key options: header only, built once per upload rather than per rerun
+@st.cache_data(show_spinner=False, max_entries=8)
+def _csv_columns_cached(path: str) -> list[str]:
+    return [str(c) for c in pd.read_csv(path, nrows=0).columns]
+
+
+def _write_csv_fast(df: pd.DataFrame, path: Path) -> None:
+    """Write via pyarrow's C CSV writer when available; fall back to pandas."""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path))
+    except Exception:
+        df.to_csv(path, index=False, chunksize=10_000)
+
+
+def _memory_mb_approx(df: pd.DataFrame, sample_rows: int = 1000) -> float:
+    """Shallow footprint plus a sampled string-length correction for object columns.
+
+    Avoids memory_usage(deep=True), which walks every Python object.
+    """
+    total = float(df.memory_usage(deep=False).sum())
+    n = len(df)
+    if n:
+        for c in df.select_dtypes(include="object").columns:
+            lens = df[c].head(sample_rows).dropna().astype(str).str.len()
+            if len(lens):
+                total += float(lens.mean()) * n
+    return total / (1024 ** 2)
+
+
 def _profile_columns(df: pd.DataFrame) -> dict:
+    # Column-wise reductions in one pass each instead of per-column dispatch
+    na = df.isna()
+    na_sum = na.sum()
+    na_pct = na.mean() * 100.0 if len(df) else na_sum * 0.0
+    num_cols = [c for c, dt in df.dtypes.items() if pd.api.types.is_numeric_dtype(dt)]
+    stats = pd.DataFrame(columns=["count", "min", "max", "mean", "std"])
+    if num_cols:
+        num = df[num_cols]
+        stats = num.agg(["count", "min", "max", "mean"]).T
+        stats["std"] = num.std(ddof=0)
+
     cols = []
-    for c in df.columns:
-        s = df[c]
+    for c, dt, n_missing, pct in zip(df.columns, df.dtypes, na_sum, na_pct):
         entry = {
             "name": str(c),
-            "dtype": str(s.dtype),
-            "missing_count": int(s.isna().sum()),
-            "missing_pct": float((s.isna().mean() * 100.0) if len(s) else 0.0),
+            "dtype": str(dt),
+            "missing_count": int(n_missing),
+            "missing_pct": float(pct),
         }
-        if pd.api.types.is_numeric_dtype(s):
-            sample = s.dropna()
-            if len(sample):
-                entry.update({
-                    "numeric_min_sample": float(sample.min()),
-                    "numeric_max_sample": float(sample.max()),
-                    "numeric_mean_sample": float(sample.mean()),
-                    "numeric_std_sample": float(sample.std(ddof=0)),
-                })
+        if c in stats.index and stats.at[c, "count"] > 0:
+            row = stats.loc[c]
+            entry.update({
+                "numeric_min_sample": float(row["min"]),
+                "numeric_max_sample": float(row["max"]),
+                "numeric_mean_sample": float(row["mean"]),
+                "numeric_std_sample": float(row["std"]),
+            })
         cols.append(entry)
     return {
         "table": {
             "n_rows": int(df.shape[0]),
             "n_cols": int(df.shape[1]),
-            "memory_mb_approx": float(df.memory_usage(deep=True).sum() / (1024 ** 2)),
+            "memory_mb_approx": _memory_mb_approx(df),
             "sample_rows_used": int(min(len(df), MAX_PREVIEW_ROWS)),
         },
         "columns": cols,
@@ -56,9 +166,48 @@ def _profile_columns(df: pd.DataFrame) -> dict:
 
 def _join_two(df_left: pd.DataFrame, df_right: pd.DataFrame,
               left_key: str, right_key: str, how: str) -> pd.DataFrame:
+    # Fast path: shared key name and a unique right key (lookup-table join) ->
+    # index join, which reuses the right index instead of building a merge hash.
+    # Output (column order, suffixes, row order) matches merge for left/inner.
+    if (
+        left_key == right_key
+        and how in ("left", "inner")
+        and df_right[right_key].is_unique
+    ):
+        out = df_left.join(
+            df_right.set_index(right_key), on=left_key, how=how, lsuffix="_x", rsuffix="_y"
+        )
+        return out.reset_index(drop=True)
     return df_left.merge(df_right, left_on=left_key, right_on=right_key, how=how)
 
 
+# Keyed on the digest-named upload paths + join params, so re-clicking Execute is free
+@st.cache_data(show_spinner="Joining…", max_entries=4)
+def _join_cached(path_left: str, path_right: str,
+                 left_key: str, right_key: str, how: str) -> pd.DataFrame:
+    return _join_two(_read_csv_cached(path_left), _read_csv_cached(path_right),
+                     left_key, right_key, how)
+
+
+def _inputs_fingerprint(path_left, path_right, join_params: dict) -> str:
+    """Identity of the Execute inputs; upload paths already embed a content digest."""
+    parts = [str(path_left), str(path_right)]
+    parts += [f"{k}={join_params[k]}" for k in sorted(join_params)]
+    return "|".join(parts)
+
+
+# `_df` is not hashed (leading underscore); the fingerprint is the cache key.
+@st.cache_data(show_spinner=False, max_entries=8)
+def _profile_cached(fp: str, _df: pd.DataFrame) -> dict:
+    return _profile_columns(_df)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _preview_cached(fp: str, _df: pd.DataFrame, n: int) -> pd.DataFrame:
+    # Detached head slice: preview/writes never touch the full merged frame
+    return _df.iloc[:n].copy()
+
+
 def render():
     st.subheader("Screen 2 — Files / Join / Profile")
 
@@ -84,23 +233,35 @@ def render():
     # 3) Uploads (keys scoped to s2_ to avoid collisions)
     c1, c2 = st.columns(2)
     with c1:
-        up_left = st.file_uploader("Primary CSV", type=["csv"], key="s2_left")
+        up_left = st.file_uploader(
+            "Primary CSV", type=["csv"], key="s2_left",
+            on_change=_mark_upload_dirty, args=("left",),
+        )
     with c2:
-        up_right = st.file_uploader("Secondary CSV (optional)", type=["csv"], key="s2_right")
+        up_right = st.file_uploader(
+            "Secondary CSV (optional)", type=["csv"], key="s2_right",
+            on_change=_mark_upload_dirty, args=("right",),
+        )
+
+    # Persist uploads once; all reads below go through the on-disk copy
+    try:
+        path_left = _persist_upload(up_left, active_slug, "left") if up_left is not None else None
+        path_right = _persist_upload(up_right, active_slug, "right") if up_right is not None else None
+    except Exception as e:
+        status(f"Failed to store uploaded CSVs: {e}", "error")
+        st.stop()
 
     # 4) If two uploads, present join controls in the requested L-M-R layout
     join_params = {}
-    if up_left is not None and up_right is not None:
-        # read heads for key lists (small nrows)
+    if path_left is not None and path_right is not None:
+        # read headers for key lists (cached per upload)
         try:
-            df_l_head = pd.read_csv(up_left, nrows=50)
-            up_left.seek(0)
+            left_cols = _csv_columns_cached(str(path_left))
         except Exception as e:
             status(f"Failed reading primary CSV for keys: {e}", "error")
             st.stop()
         try:
-            df_r_head = pd.read_csv(up_right, nrows=50)
-            up_right.seek(0)
+            right_cols = _csv_columns_cached(str(path_right))
         except Exception as e:
             status(f"Failed reading secondary CSV for keys: {e}", "error")
             st.stop()
@@ -112,32 +273,36 @@ def render():
 
         cL, cM, cR = st.columns([1, 1, 1])
         with cL:
-            left_key = st.selectbox("Join key (left)", list(df_l_head.columns), key=key_left)
+            left_key = st.selectbox("Join key (left)", left_cols, key=key_left)
         with cM:
-            right_key = st.selectbox("Join key (right)", list(df_r_head.columns), key=key_right)
+            right_key = st.selectbox("Join key (right)", right_cols, key=key_right)
         with cR:
-            how = st.selectbox("Join type", ["inner", "left", "right", "outer"], index=0, key=key_how)
+            how = st.selectbox("Join type", _JOIN_TYPES, index=0, key=key_how)
 
         join_params = {"left_key": left_key, "right_key": right_key, "how": how}
 
+    _execute_and_preview(active_slug, path_left, path_right, join_params)
+
+
+@_fragment
+def _execute_and_preview(active_slug: str, path_left, path_right, join_params: dict) -> None:
+    """Execute + artifact writes + preview; clicking Execute reruns only this block."""
     do_exec = st.button("Execute", key="s2_exec")
 
     if not do_exec:
-        st.stop()
+        return
 
     # 5) Execute read/join
     try:
-        if up_left is None:
+        if path_left is None:
             status("Please upload at least one CSV.", "warn")
             st.stop()
 
-        df_left = _read_csv(up_left)
-
-        if up_right is not None and join_params:
-            df_right = _read_csv(up_right)
-            df_merged = _join_two(df_left, df_right, **join_params)
+        current_fp = _inputs_fingerprint(path_left, path_right, join_params)
+        if path_right is not None and join_params:
+            df_merged = _join_cached(str(path_left), str(path_right), **join_params)
         else:
-            df_merged = df_left
+            df_merged = _read_csv_cached(str(path_left))
 
     except Exception as e:
         status(f"Failed to read/join CSVs: {e}", "error")
@@ -145,13 +310,14 @@ def render():
 
     # 6) Preview + write artifacts using the canonical slug (no new timestamps)
     try:
-        preview = df_merged.head(MAX_PREVIEW_ROWS)
+        # Cached head slice; the full frame is only needed for profiling
+        preview = _preview_cached(current_fp, df_merged, MAX_PREVIEW_ROWS)
         preview_path = _artifact(active_slug, "merged_preview.csv")
         profile_path = _artifact(active_slug, "merged_profile.json")
 
         # Write files
-        preview.to_csv(preview_path, index=False)
-        write_json(_profile_columns(df_merged), profile_path)
+        _write_csv_fast(preview, preview_path)
+        write_json(_profile_cached(current_fp, df_merged), profile_path)
 
     except Exception as e:
         status(f"Failed to write artifacts: {e}", "error")
@@ -2,24 +2,54 @@
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
-from typing import List, Dict
 
 import pandas as pd
 import streamlit as st
 
+try:  # optional fast path: parse straight from bytes in C
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    _orjson = None
+
 from ui.blocks import status
 from services.artifacts import ARTIFACTS_DIR
 from services.roles import validate_roles, save_roles_json, Role
 from services.session import get_active_slug  # <- Screen 1 is the sole authority
 
 
+_ROLE_OPTIONS: tuple[str, ...] = ("feature", "response", "id", "time", "ignore")
+_ROLE_INDEX: dict[str, int] = {r: i for i, r in enumerate(_ROLE_OPTIONS)}
+
+_ID_NAMES = frozenset({"id", "run_id", "wafer_id", "lot_id"})
+_TIME_RE = re.compile(r"time|date", re.I)  # "time" also covers "timestamp"
+
+
 # ---------- artifact helpers ----------
 
 def _artifact(slug: str, suffix: str) -> Path:
     return ARTIFACTS_DIR / f"{slug}_{suffix}"
 
-def _load_columns_for_slug(slug: str) -> List[str]:
+def _mtime(path: Path) -> float | None:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+def _columns_key(slug: str) -> tuple[str, float | None, float | None]:
+    """Cache key for the column list: changes whenever S2 rewrites either artifact."""
+    return (
+        slug,
+        _mtime(_artifact(slug, "merged_preview.csv")),
+        _mtime(_artifact(slug, "merged_profile.json")),
+    )
+
+@st.cache_data(show_spinner=False)
+def _load_columns_cached(key: tuple[str, float | None, float | None]) -> list[str]:
+    return _load_columns_for_slug(key[0])
+
+def _load_columns_for_slug(slug: str) -> list[str]:
     """
     Read columns for the **exact** session slug:
       1) <slug>_merged_preview.csv (header only)
@@ -38,8 +68,11 @@ def _load_columns_for_slug(slug: str) -> List[str]:
     profile_json = _artifact(slug, "merged_profile.json")
     if profile_json.exists():
         try:
-            with profile_json.open("r", encoding="utf-8") as f:
-                prof = json.load(f)
+            if _orjson is not None:
+                prof = _orjson.loads(profile_json.read_bytes())
+            else:
+                with profile_json.open("r", encoding="utf-8") as f:
+                    prof = json.load(f)
             if isinstance(prof, dict) and isinstance(prof.get("columns"), list):
                 return list(prof["columns"])
         except Exception:
@@ -48,10 +81,9 @@ def _load_columns_for_slug(slug: str) -> List[str]:
     return []
 
 def _default_role_for_col(col: str) -> Role:
-    c = col.lower()
-    if c in ("id", "run_id", "wafer_id", "lot_id"):
+    if col.lower() in _ID_NAMES:
         return "id"
-    if "time" in c or "timestamp" in c or "date" in c:
+    if _TIME_RE.search(col):
         return "time"
     return "feature"
 
@@ -70,31 +102,41 @@ def render():
     st.caption(f"Session: `{active_slug}`")
 
     # Load columns for this slug only
-    cols = _load_columns_for_slug(active_slug)
+    cols = _load_columns_cached(_columns_key(active_slug))
     if not cols:
         status("No merged table columns found for this session. Complete Screen 2 (Files / Join / Profile) first.", "warn")
         st.stop()
 
     st.write("Assign a role for each column and **Save**. You need at least one **feature** and one **response**.")
 
-    role_options: List[Role] = ["feature", "response", "id", "time", "ignore"]
-
     key_prefix = f"roles_{active_slug}_"
     if key_prefix not in st.session_state:
         st.session_state[key_prefix] = {c: _default_role_for_col(c) for c in cols}
 
-    mapping: Dict[str, Role] = st.session_state[key_prefix]
-
-    for c in cols:
-        current = mapping.get(c, "feature")
-        chosen = st.selectbox(
-            label=c,
-            options=role_options,
-            index=role_options.index(current) if current in role_options else 0,
-            key=f"{key_prefix}{c}",
-            help="Each column must have exactly one role.",
-        )
-        mapping[c] = chosen
+    mapping: dict[str, Role] = st.session_state[key_prefix]
+
+    # One editor for all columns: a single widget instead of one selectbox per column
+    roles_df = pd.DataFrame({
+        "column": cols,
+        "role": [mapping.get(c) if mapping.get(c) in _ROLE_INDEX else "feature" for c in cols],
+    })
+    edited = st.data_editor(
+        roles_df,
+        column_config={
+            "column": st.column_config.TextColumn("Column", disabled=True),
+            "role": st.column_config.SelectboxColumn(
+                "Role",
+                options=list(_ROLE_OPTIONS),
+                required=True,
+                help="Each column must have exactly one role.",
+            ),
+        },
+        hide_index=True,
+        num_rows="fixed",
+        use_container_width=True,
+        key=f"roles_editor_{active_slug}",
+    )
+    mapping.update(zip(edited["column"], edited["role"]))
 
     st.divider()
 
@@ -54,6 +54,20 @@ _FLAG_PENDING_LOAD = "_pending_load_slug"       # slug to load pre-widgets
 _FLAG_PENDING_RESET = "_pending_reset_screen1"  # reset Screen 1 fields pre-widgets
 _FLAG_LAST_SAVE_MSG = "_last_save_message"      # transient info banner
 
+_SESSION_PICKER_MAX = 100  # newest sessions offered in the picker
+
+_FOOTER_TIP = (
+    "Tip: Saving creates a new JSON under `artifacts/` using contract v3 naming "
+    "(`<session_slug>-session-setup.json`). Loading will prefill fields. "
+    "Reset uses a safe flag → rerun → apply pattern."
+)
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _cached_discover(limit: int | None = None) -> list[tuple[str, str, str]]:
+    """Short-lived cache over the artifacts/ scan; cleared on save."""
+    return discover_session_setups(limit=limit)
+
 
 def _init_defaults() -> None:
     """Ensure default keys exist without overwriting user input."""
@@ -133,19 +147,21 @@ def render() -> None:
 
     with col_left:
         st.markdown("#### Define or edit session")
-        st.text_input("Context tag", key=_KEY_CTX, placeholder="e.g., cmp-pilot")
-        st.selectbox("Objective", options=["maximize", "minimize"], key=_KEY_OBJ)
-        st.text_input("Response metric", key=_KEY_RESP, placeholder="e.g., mrr")
+        # Inputs + Save in one form: typing doesn't rerun the script, only Save does
+        with st.form("s1_form", border=False):
+            st.text_input("Context tag", key=_KEY_CTX, placeholder="e.g., cmp-pilot")
+            st.selectbox("Objective", options=["maximize", "minimize"], key=_KEY_OBJ)
+            st.text_input("Response metric", key=_KEY_RESP, placeholder="e.g., mrr")
+            submitted = st.form_submit_button("Save new session", use_container_width=True)
+        if submitted:
+            _on_click_save()
 
         # Current active slug (if any)
         if ss.get(_KEY_CURR_SLUG):
             st.caption(f"Active session slug: **{ss[_KEY_CURR_SLUG]}**")
 
-        # Actions
-        save_col, load_col, reset_col = st.columns(3)
-        with save_col:
-            if st.button("Save new session", use_container_width=True):
-                _on_click_save()
+        # Load/Reset stay outside the form so they act immediately
+        load_col, reset_col = st.columns(2)
         with load_col:
             if st.button("Load selected", use_container_width=True):
                 selected_slug = ss.get("_session_picker_slug", "")
@@ -163,46 +179,42 @@ def render() -> None:
 
     with col_right:
         st.markdown("#### Existing sessions")
-        sessions = discover_session_setups(limit=None)
+        sessions = _cached_discover(None)
         if not sessions:
             st.write("No saved sessions yet.")
         else:
-            # Build label list: "YYMMDD-context-objective-response  (mtime)"
-            labels = [
-                f"{slug}  ({mtime_iso_utc})"
-                for (slug, _path, mtime_iso_utc) in sessions
-            ]
-            # Default selection to current session if present
-            default_index = 0
-            current_slug = ss.get(_KEY_CURR_SLUG, "")
-            if current_slug:
-                for i, (slug, _, _) in enumerate(sessions):
-                    if slug == current_slug:
-                        default_index = i
-                        break
-
-            sel = st.selectbox(
-                "Pick a session to load",
-                options=list(range(len(labels))),
-                format_func=lambda i: labels[i],
-                index=default_index if sessions else 0,
-                key="_session_picker_index",
-            )
-            # Cache the selected slug for the Load button
-            if 0 <= sel < len(sessions):
-                picked_slug = sessions[sel][0]
+            filt = st.text_input("Filter sessions", key="_session_filter", placeholder="part of a slug")
+            if filt:
+                needle = filt.strip().lower()
+                sessions = [t for t in sessions if needle in t[0].lower()]
+            # Already newest → oldest; keep the dropdown bounded for large artifacts/ dirs
+            shown = sessions[:_SESSION_PICKER_MAX]
+            if len(sessions) > len(shown):
+                st.caption(f"Showing the {len(shown)} most recent of {len(sessions)}; use the filter to find older ones.")
+
+            if not shown:
+                st.write("No sessions match the filter.")
+                ss["_session_picker_slug"] = ""
+            else:
+                slugs = [slug for (slug, _path, _mtime) in shown]
+                slug_to_idx = {slug: i for i, slug in enumerate(slugs)}
+                # Default selection to current session if present
+                default_index = slug_to_idx.get(ss.get(_KEY_CURR_SLUG, ""), 0)
+
+                picked_slug = st.selectbox(
+                    "Pick a session to load",
+                    options=slugs,
+                    index=default_index,
+                    key="_session_picker_choice",
+                )
+                # Cache the selected slug for the Load button
                 ss["_session_picker_slug"] = picked_slug
-                st.caption(f"Selected slug: **{picked_slug}**")
+                picked_idx = slug_to_idx.get(picked_slug)
+                mtime_iso_utc = shown[picked_idx][2] if picked_idx is not None else ""
+                st.caption(f"Selected slug: **{picked_slug}**  ({mtime_iso_utc})")
 
     # Footer note
-    st.markdown(
-        "<span style='font-size:0.9em;color:gray;'>"
-        "Tip: Saving creates a new JSON under <code>artifacts/</code> using contract v3 naming "
-        "(<code>&lt;session_slug&gt;-session-setup.json</code>). Loading will prefill fields. "
-        "Reset uses a safe flag → rerun → apply pattern."
-        "</span>",
-        unsafe_allow_html=True,
-    )
+    st.caption(_FOOTER_TIP)
 
 
 # ---------------
@@ -231,6 +243,7 @@ def _on_click_save() -> None:
 
     try:
         slug, path = save_new_session_setup(context, objective, response)
+        _cached_discover.clear()  # the new file must show up immediately
         ss[_KEY_CURR_SLUG] = slug
         ss[_FLAG_LAST_SAVE_MSG] = f"Saved session: {slug} → {path}"
         st.rerun()
@@ -3,10 +3,30 @@ from __future__ import annotations
 from pathlib import Path
 from typing import IO, Optional, Union
 
+import numpy as np
 import pandas as pd
 
+try:  # multi-threaded C++ CSV parser; pandas stays the reference/fallback path
+    from pyarrow import csv as _pacsv
+    import pyarrow as _pa
+    import pyarrow.compute as _pc
+except Exception:  # pragma: no cover - pyarrow missing or ABI-incompatible
+    _pacsv = None
+    _pa = None
+    _pc = None
+
 Src = Union[str, Path, IO]
 
+# pandas' default na_values (pandas._libs.parsers.STR_NA_VALUES)
+_PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+def _pandas_compatible_names(names: list[str]) -> bool:
+    # pandas mangles duplicate/blank headers ("a.1", "Unnamed: 0"); leave those files to pandas
+    return all(names) and len(set(names)) == len(names)
+
 def _reset_stream(src: Src) -> None:
     # Streamlit's UploadedFile and StringIO have .seek; reset to start before re-reading
     if hasattr(src, "seek"):
@@ -15,6 +35,46 @@ def _reset_stream(src: Src) -> None:
         except Exception:
             pass
 
+def _read_with_pyarrow(src: Src) -> pd.DataFrame:
+    """
+    Parse with pyarrow, normalized to what pandas returns (UTF-8 only). Raises on anything
+    it can't type like pandas (date/time inference, >int64 integers, mangled headers) so
+    callers fall back.
+    """
+    if isinstance(src, Path):
+        src = str(src)
+    table = _pacsv.read_csv(
+        src,
+        read_options=_pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+        convert_options=_pacsv.ConvertOptions(
+            null_values=_PANDAS_NA_VALUES,
+            strings_can_be_null=True,
+            true_values=["True", "TRUE", "true"],
+            false_values=["False", "FALSE", "false"],
+        ),
+    )
+    if not _pandas_compatible_names(table.column_names):
+        raise ValueError("header needs pandas name mangling")
+    fields = []
+    for f in table.schema:
+        if _pa.types.is_temporal(f.type):
+            raise ValueError(f"column {f.name!r}: pandas would keep date/time text as strings")
+        if _pa.types.is_floating(f.type):
+            big = _pc.max(_pc.abs(table.column(f.name))).as_py()
+            if big is not None and big >= 2.0 ** 63:
+                raise ValueError(f"column {f.name!r} holds values beyond int64")
+        # All-empty columns: arrow's null type, pandas' float64 NaN
+        fields.append(_pa.field(f.name, _pa.float64()) if _pa.types.is_null(f.type) else f)
+    df = table.cast(_pa.schema(fields)).to_pandas(split_blocks=True, self_destruct=True)
+    # Arrow nulls surface as None in object columns; pandas uses NaN
+    for c in [c for c, dt in df.dtypes.items() if pd.api.types.is_object_dtype(dt)]:
+        vals = df[c].to_numpy(dtype=object, copy=True)
+        na = pd.isna(vals)
+        if na.any():
+            vals[na] = np.nan
+            df[c] = vals
+    return df
+
 def read_csv_safely(src: Src, nrows: Optional[int] = None) -> pd.DataFrame:
     """
     Read a CSV with sane defaults and simple encoding fallback.
@@ -22,8 +82,19 @@ def read_csv_safely(src: Src, nrows: Optional[int] = None) -> pd.DataFrame:
       - file paths (str/Path)
       - in-memory streams (StringIO/BytesIO)
       - Streamlit UploadedFile objects
+    Full reads use pyarrow's threaded parser when available; pandas handles nrows
+    previews (typed from those rows only), text streams, non-UTF-8 files and anything
+    pyarrow can't type like pandas.
     """
     _reset_stream(src)
+    if _pacsv is not None and nrows is None:
+        try:
+            return _read_with_pyarrow(src)
+        except Exception:
+            _reset_stream(src)
+    return _read_with_pandas(src, nrows)
+
+def _read_with_pandas(src: Src, nrows: Optional[int] = None) -> pd.DataFrame:
     try:
         df = pd.read_csv(src, nrows=nrows, low_memory=False)
     except UnicodeDecodeError:
@@ -34,8 +105,24 @@ def read_csv_safely(src: Src, nrows: Optional[int] = None) -> pd.DataFrame:
 def sniff_columns(src: Src) -> list[str]:
     """
     Return column names without loading all rows (header-only parse).
+    With pyarrow, only the first 64 KiB block is decoded to get the schema.
     """
-    df0 = read_csv_safely(src, nrows=0)
+    _reset_stream(src)
+    if _pacsv is not None:
+        try:
+            reader = _pacsv.open_csv(
+                str(src) if isinstance(src, Path) else src,
+                read_options=_pacsv.ReadOptions(use_threads=False, block_size=64 * 1024),
+            )
+            names = list(reader.schema.names)
+            if _pandas_compatible_names(names):
+                return names
+        except Exception:
+            pass
+        finally:
+            _reset_stream(src)
+    df0 = _read_with_pandas(src, nrows=0)
+    _reset_stream(src)
     return [str(c) for c in df0.columns.tolist()]
 
 def join_frames(
@@ -46,12 +133,11 @@ def join_frames(
     how: str = "inner",
 ) -> pd.DataFrame:
     """
-    Lightweight join wrapper with defensive copies and clear errors.
+    Lightweight join wrapper with clear errors.
+    Inputs are not mutated: merge always builds a new frame, so no defensive copies are made.
     """
     if left_key not in left.columns:
         raise KeyError(f"Left key '{left_key}' not in left columns.")
     if right_key not in right.columns:
         raise KeyError(f"Right key '{right_key}' not in right columns.")
-    L = left.copy()
-    R = right.copy()
-    return L.merge(R, left_on=left_key, right_on=right_key, how=how)
+    return left.merge(right, left_on=left_key, right_on=right_key, how=how)
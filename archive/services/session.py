@@ -4,6 +4,11 @@ from typing import Optional, Tuple, List, Dict, Any
 from pathlib import Path
 import json
 import streamlit as st
+
+try:  # optional fast path: parse straight from bytes in C
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    _orjson = None
 from services.artifacts import ARTIFACTS_DIR
 
 SESSION_KEY = "session_slug"
@@ -21,8 +26,18 @@ def discover_session_slugs() -> List[Tuple[str, float]]:
     """List (slug, mtime) for <slug>_session_setup.json, newest first."""
     if not ARTIFACTS_DIR.exists():
         return []
+    try:
+        dir_mtime_ns = ARTIFACTS_DIR.stat().st_mtime_ns
+    except OSError:
+        dir_mtime_ns = 0
+    # Directory mtime changes when files are created/removed, busting the cache;
+    # the short TTL covers in-place rewrites that only touch file mtimes.
+    return list(_discover_session_slugs_cached(str(ARTIFACTS_DIR), dir_mtime_ns))
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _discover_session_slugs_cached(artifacts_dir: str, dir_mtime_ns: int) -> List[Tuple[str, float]]:
     pairs: List[Tuple[str, float]] = []
-    for p in ARTIFACTS_DIR.glob("*_session_setup.json"):
+    for p in Path(artifacts_dir).glob("*_session_setup.json"):
         try:
             slug = p.name.replace("_session_setup.json", "")
             pairs.append((slug, p.stat().st_mtime))
@@ -39,6 +54,8 @@ def load_session_setup(slug: str) -> Optional[Dict[str, Any]]:
     if not p.exists():
         return None
     try:
+        if _orjson is not None:
+            return _orjson.loads(p.read_bytes())
         with p.open("r", encoding="utf-8") as f:
             return json.load(f)
     except Exception:
@@ -1,11 +1,14 @@
 import streamlit as st
 from services import s2_adapter
+from utils.ui_state import ensure_defaults
 
 def render() -> dict:
     st.header("Files · Join · Profile (S2)")
     # Phase 1 minimal widgets (no file handling yet)
-    features_loaded = st.checkbox("Features CSV loaded (stub)", value=True)
-    response_loaded = st.checkbox("Response CSV loaded (stub)", value=False)
+    # Seed once and bind by key; a value= default would fight the user's toggle on reruns
+    ensure_defaults({"s2_features_loaded": True, "s2_response_loaded": False})
+    features_loaded = st.checkbox("Features CSV loaded (stub)", key="s2_features_loaded")
+    response_loaded = st.checkbox("Response CSV loaded (stub)", key="s2_response_loaded")
 
     ok_files, errs = s2_adapter.validate_files(features_loaded, response_loaded)
     if errs: st.info(" • " + "\n • ".join(errs))
@@ -12,6 +12,7 @@ Public API kept stable:
 
 Back-compat helpers re-exported:
 - safe_path, save_json, load_json, save_csv
+- dump_json_bytes, save_json_bytes (serialize once, write many)
 - compute_roles_signature
 """
 
@@ -31,6 +32,8 @@ from .artifacts_core import (
     write_json_with_log,
     compute_roles_signature,
     save_json,
+    dump_json_bytes,
+    save_json_bytes,
     load_json,
     save_csv,
     safe_path,  # <-- re-export to satisfy legacy tests/imports
@@ -45,6 +48,8 @@ __all__ = [
     # helpers (back-compat)
     "safe_path",
     "save_json",
+    "dump_json_bytes",
+    "save_json_bytes",
     "load_json",
     "save_csv",
     "compute_roles_signature",
@@ -21,6 +21,11 @@ import tempfile
 
 import pandas as pd
 
+try:  # optional fast path: parse straight from bytes in C
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    _orjson = None
+
 # Prefer project constants; fall back to sane defaults during early scaffolding.
 try:
     from utils.constants import ARTIFACTS_DIR, SCHEMA_VERSION
@@ -31,6 +36,10 @@ except Exception:
 from utils.logging import log_event  # per-screen JSONL write events
 
 
+# Rows per to_csv chunk; bounds peak memory of the formatted text on large frames.
+CSV_CHUNK_ROWS = 50_000
+
+
 # ---------- paths & atomic ----------
 
 def _ensure_dir(p: Path) -> None:
@@ -93,6 +102,14 @@ def atomic_write_bytes(path: Path, data: bytes) -> int:
     return path.stat().st_size
 
 
+def stream_csv(df: pd.DataFrame, path: Path, chunksize: int = CSV_CHUNK_ROWS) -> int:
+    """Write df as CSV in row chunks through a 1 MiB buffered handle; return bytes written."""
+    _ensure_dir(path)
+    with open(path, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+        df.to_csv(f, index=False, chunksize=chunksize)
+    return path.stat().st_size
+
+
 # ---------- hashing ----------
 
 def sha256_file(p: Path) -> str:
@@ -126,8 +143,7 @@ def write_csv_with_log(
 ) -> Dict[str, Any]:
     out = session_dir(session_slug, root) / artifact_name
     rows = int(df.shape[0])
-    df.to_csv(out, index=False, encoding="utf-8")
-    bytes_ = out.stat().st_size
+    bytes_ = stream_csv(df, out)
 
     # If this is the canonical dataset CSV and no hash provided, compute now.
     if artifact_name == "merged.csv" and dataset_hash is None:
@@ -182,16 +198,30 @@ def write_json_with_log(
 
 # ---------- back-compat generic helpers (used by tests/tools) ----------
 
-def save_json(obj: Any, filename: str, root: Union[str, Path] = ".") -> Path:
+def dump_json_bytes(obj: Any) -> bytes:
+    """Serialize once (same format as save_json); reuse the bytes across writes."""
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+def save_json_bytes(data: bytes, filename: str, root: Union[str, Path] = ".") -> Path:
+    """Write pre-serialized JSON bytes (see dump_json_bytes) without re-encoding."""
     p = safe_path(filename, root=root)
-    atomic_write_text(p, json.dumps(obj, ensure_ascii=False, indent=2))
+    atomic_write_bytes(p, data)
     return p
 
+def save_json(obj: Any, filename: str, root: Union[str, Path] = ".") -> Path:
+    return save_json_bytes(dump_json_bytes(obj), filename, root=root)
+
 def load_json(filename: str, root: Union[str, Path] = ".") -> Any:
     p = safe_path(filename, root=root)
-    return json.loads(p.read_text(encoding="utf-8"))
+    data = p.read_bytes()
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass  # NaN/Infinity or >64-bit ints: stdlib json accepts what save_json can emit
+    return json.loads(data.decode("utf-8"))
 
 def save_csv(df: pd.DataFrame, filename: str, root: Union[str, Path] = ".") -> Path:
     p = safe_path(filename, root=root)
-    df.to_csv(p, index=False)
+    stream_csv(df, p)
     return p
@@ -26,7 +26,14 @@ def _fallback(df: pd.DataFrame, group_keys: List[str], rule_map: Dict[str, str])
         agg[col] = _RULES[rule]
     if not agg:
         raise ValueError("No applicable columns to aggregate.")
-    return df.groupby(group_keys, dropna=False).agg(agg).reset_index()
+    # One cythonized reduction per rule over all its columns (not one dispatch per column),
+    # then restore the rule_map column order.
+    g = df.groupby(group_keys, dropna=False)
+    cols_by_func: Dict[str, List[str]] = {}
+    for col, func in agg.items():
+        cols_by_func.setdefault(func, []).append(col)
+    parts = [getattr(g[cols], func)() for func, cols in cols_by_func.items()]
+    return pd.concat(parts, axis=1)[list(agg)].reset_index()
 
 def run_collapse(df: pd.DataFrame, group_keys: List[str], rule_map: Dict[str, str]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     if _HAS_SERVICE:
@@ -1,8 +1,90 @@
 """Lightweight CSV I/O for MVP tests."""
 from __future__ import annotations
+import io
+import numpy as np
 import pandas as pd
 from typing import Union, IO
 
+try:  # multi-threaded C++ CSV parser; pandas stays the reference path
+    import pyarrow as _pa
+    import pyarrow.compute as _pc
+    from pyarrow import csv as _pacsv
+except Exception:  # pragma: no cover - pyarrow missing or ABI-incompatible
+    _pa = None
+    _pc = None
+    _pacsv = None
+
+# pandas' default na_values (pandas._libs.parsers.STR_NA_VALUES)
+_PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+
+def _pandas_compatible_names(names: list[str]) -> bool:
+    # pandas mangles duplicate/blank headers ("a.1", "Unnamed: 0"); leave those files to pandas
+    return all(names) and len(set(names)) == len(names)
+
+
+def _read_csv_arrow(data: Union[str, bytes]) -> pd.DataFrame:
+    """Parse with pyarrow, normalized to what pd.read_csv returns; raises when it can't match."""
+    def _read(column_types: dict) -> "_pa.Table":
+        return _pacsv.read_csv(
+            io.BytesIO(data) if isinstance(data, bytes) else data,
+            read_options=_pacsv.ReadOptions(use_threads=True, block_size=1 << 20),
+            convert_options=_pacsv.ConvertOptions(
+                column_types=column_types,
+                null_values=_PANDAS_NA_VALUES,
+                strings_can_be_null=True,
+                true_values=["True", "TRUE", "true"],
+                false_values=["False", "FALSE", "false"],
+            ),
+        )
+
+    table = _read({})
+    if not _pandas_compatible_names(table.column_names):
+        raise ValueError("header needs pandas name mangling")
+    # Arrow infers dates/times even without timestamp parsers; pandas leaves them as text
+    as_text = {f.name: _pa.string() for f in table.schema if _pa.types.is_temporal(f.type)}
+    if as_text:
+        table = _read(as_text)
+    # All-empty columns: arrow's null type, pandas' float64 NaN
+    if any(_pa.types.is_null(f.type) for f in table.schema):
+        table = table.cast(_pa.schema([
+            _pa.field(f.name, _pa.float64()) if _pa.types.is_null(f.type) else f for f in table.schema
+        ]))
+    # Integers beyond int64 become doubles in arrow but uint64/object in pandas
+    for f in table.schema:
+        if _pa.types.is_floating(f.type):
+            big = _pc.max(_pc.abs(table.column(f.name))).as_py()
+            if big is not None and big >= 2.0 ** 63:
+                raise ValueError(f"column {f.name!r} holds values beyond int64")
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    # Arrow nulls surface as None in object columns; pandas uses NaN
+    for c in [c for c, dt in df.dtypes.items() if pd.api.types.is_object_dtype(dt)]:
+        vals = df[c].to_numpy(dtype=object, copy=True)
+        na = pd.isna(vals)
+        if na.any():
+            vals[na] = np.nan
+            df[c] = vals
+    return df
+
+
 def read_csv_lite(src: Union[str, bytes, IO]) -> pd.DataFrame:
-    """Read a CSV using pandas defaults (UTF-8)."""
+    """Read a CSV (UTF-8) with pandas defaults; pyarrow does the parsing when available."""
+    if _pacsv is not None:
+        pos = src.tell() if hasattr(src, "tell") else None
+        try:
+            data = src.read() if hasattr(src, "read") else src
+            if isinstance(data, (bytearray, memoryview)):
+                data = bytes(data)
+            elif hasattr(src, "read") and not isinstance(data, bytes):
+                raise TypeError("text stream")  # pyarrow parses bytes only
+            return _read_csv_arrow(data)
+        except Exception:
+            # Ragged/odd files or output pandas would type differently: use pandas from the original position
+            if pos is not None and hasattr(src, "seek"):
+                src.seek(pos)
+    if isinstance(src, (bytes, bytearray)):
+        src = io.BytesIO(src)
     return pd.read_csv(src)
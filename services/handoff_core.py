@@ -14,10 +14,14 @@ from __future__ import annotations
 import csv
 import hashlib
 import json
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+from typing import Dict, List, Tuple, Optional, Union
+from datetime import datetime, timezone
 
 # Prefer project constants; fall back to default schema_version
 try:
@@ -66,6 +70,9 @@ OPTIONAL = {
     ]
 }
 
+# Upper bound on threads used to hash artifacts in compute_fingerprints
+_HASH_WORKERS = min(8, os.cpu_count() or 1)
+
 # ---------------------------
 # Basic time & IO utilities
 # ---------------------------
@@ -73,13 +80,17 @@ OPTIONAL = {
 def _now_iso_utc() -> str:
     return datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
 
-def _now_iso_local() -> str:
-    return datetime.now().astimezone().replace(microsecond=0).isoformat()
+def _now_iso_pair() -> Tuple[str, str]:
+    """(UTC 'Z', local with offset) second-precision ISO stamps from a single clock read."""
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    return now.strftime("%Y-%m-%dT%H:%M:%SZ"), now.astimezone().isoformat()
 
+@lru_cache(maxsize=1)
 def _local_tz_name() -> str:
     """
     Best-effort local timezone name without external deps.
     Tries tzinfo.key (py3.9+ zoneinfo-backed), falls back to str(tzinfo), else 'local'.
+    Resolved once per process; the lookup can hit /etc/localtime.
     """
     try:
         tz = datetime.now().astimezone().tzinfo
@@ -91,37 +102,64 @@ def _local_tz_name() -> str:
     except Exception:
         return "local"
 
-def _sha256_file(p: Path) -> Optional[str]:
-    if not p.exists() or not p.is_file():
+def _stat_key(p: Union[str, Path]) -> Optional[Tuple[str, int, int]]:
+    """(abspath, size, mtime_ns) for a regular file, else None; busts memos on rewrite.
+
+    Plain os.stat/os.path on the string: no Path allocation and no resolve() walk.
+    """
+    try:
+        st = os.stat(p)
+    except OSError:
         return None
-    h = hashlib.sha256()
-    with p.open("rb") as f:
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return os.path.abspath(p), st.st_size, st.st_mtime_ns
+
+@lru_cache(maxsize=128)
+def _sha256_cached(path: str, size: int, mtime_ns: int) -> str:
+    # size/mtime_ns are part of the key only: any rewrite of the file busts the entry
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # py3.11+: hashes via a reused buffer, no per-chunk bytes
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
         for chunk in iter(lambda: f.read(1024 * 1024), b""):
             h.update(chunk)
     return h.hexdigest()
 
-def _read_json(p: Path) -> Optional[dict]:
-    if not p.exists():
-        return None
+def _sha256_file(p: Union[str, Path]) -> Optional[str]:
+    """Content hash, memoized on (path, size, mtime) so S6 reruns only hash changed files."""
+    key = _stat_key(p)
+    return _sha256_cached(*key) if key else None
+
+@lru_cache(maxsize=64)
+def _read_json_cached(path: str, size: int, mtime_ns: int) -> Optional[dict]:
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
     except Exception:
         return None
 
-def _csv_count_rows(p: Path) -> Optional[int]:
-    if not p.exists():
-        return None
+def _read_json(p: Union[str, Path]) -> Optional[dict]:
+    """Parsed JSON memoized on (path, size, mtime); callers must not mutate the result."""
+    key = _stat_key(p)
+    return _read_json_cached(*key) if key else None
+
+@lru_cache(maxsize=64)
+def _csv_count_rows_cached(path: str, size: int, mtime_ns: int) -> Optional[int]:
     try:
-        with p.open("r", encoding="utf-8", newline="") as f:
-            reader = csv.reader(f)
-            rows = list(reader)
-        if not rows:
-            return 0
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            # stream rows instead of materializing the whole file as lists
+            n_rows = sum(1 for _ in csv.reader(f))
         # assume first row is header
-        return max(0, len(rows) - 1)
+        return max(0, n_rows - 1)
     except Exception:
         return None
 
+def _csv_count_rows(p: Union[str, Path]) -> Optional[int]:
+    """Data-row count memoized on (path, size, mtime) so S6 reruns skip rescans."""
+    key = _stat_key(p)
+    return _csv_count_rows_cached(*key) if key else None
+
 # ---------------------------
 # Data containers
 # ---------------------------
@@ -149,23 +187,35 @@ class Fingerprints:
 # Core behavior
 # ---------------------------
 
+def _dir_names(d: Path) -> frozenset:
+    """Entry names in d from one os.scandir pass (empty if d is missing)."""
+    try:
+        with os.scandir(d) as it:
+            return frozenset(e.name for e in it)
+    except OSError:
+        return frozenset()
+
+
 def discover_artifacts(slug: str, artifacts_dir: Path) -> Discovery:
     """Locate required & optional artifacts; record missing required by basename."""
     artifacts_dir.mkdir(parents=True, exist_ok=True)
     inc: Dict[str, List[str]] = {k: [] for k in ["session", "data", "modeling", "optimization", "logs"]}
     missing: List[str] = []
 
+    # One directory listing each for flat and foldered layouts instead of a stat per candidate
+    slug_dir = artifacts_dir / slug
+    flat_names = _dir_names(artifacts_dir)
+    folder_names = _dir_names(slug_dir)
+
     def _resolve(fname: str) -> Optional[Path]:
         # Try flat first
-        p_flat = artifacts_dir / fname
-        if p_flat.exists():
-            return p_flat
+        if fname in flat_names:
+            return artifacts_dir / fname
         # If name is slug-prefixed, map to foldered artifacts/<slug>/<name>
         if fname.startswith(f"{slug}_"):
             name_only = fname[len(slug) + 1 :]
-            p_folder = artifacts_dir / slug / name_only
-            if p_folder.exists():
-                return p_folder
+            if name_only in folder_names:
+                return slug_dir / name_only
         return None
 
     # required
@@ -182,20 +232,20 @@ def discover_artifacts(slug: str, artifacts_dir: Path) -> Discovery:
     for fname in OPTIONAL["logs"]:
         # OPTIONAL may include either slugless or slugged patterns; accept .json or .jsonl
         candidates = [
-            artifacts_dir / fname,
-            artifacts_dir / slug / fname,
-            artifacts_dir / slug / f"{slug}_{fname}",
+            (flat_names, artifacts_dir, fname),
+            (folder_names, slug_dir, fname),
+            (folder_names, slug_dir, f"{slug}_{fname}"),
         ]
         if fname.endswith(".json"):
             alt = fname[:-5] + ".jsonl"
             candidates += [
-                artifacts_dir / alt,
-                artifacts_dir / slug / alt,
-                artifacts_dir / slug / f"{slug}_{alt}",
+                (flat_names, artifacts_dir, alt),
+                (folder_names, slug_dir, alt),
+                (folder_names, slug_dir, f"{slug}_{alt}"),
             ]
-        for candidate in candidates:
-            if candidate.exists():
-                inc["logs"].append(str(candidate))
+        for names, parent, name in candidates:
+            if name in names:
+                inc["logs"].append(str(parent / name))
                 break
 
     return Discovery(included=inc, missing=missing)
@@ -205,7 +255,7 @@ def summarize(slug: str, inc: Dict[str, List[str]]) -> Summary:
     """Derive summary metrics from discovered artifacts (tolerant of missing)."""
     # records from modeling_ready.csv
     modeling_ready = _first_match(inc["data"], suffix="_modeling_ready.csv")
-    records = _csv_count_rows(Path(modeling_ready)) if modeling_ready else 0
+    records = _csv_count_rows(modeling_ready) if modeling_ready else 0
 
     # features & champion model stats
     champion_path = _first_match(inc["modeling"], suffix="_champion_bundle.json")
@@ -213,7 +263,7 @@ def summarize(slug: str, inc: Dict[str, List[str]]) -> Summary:
     model_type = None
     r2_cv = None
     if champion_path:
-        champ = _read_json(Path(champion_path)) or {}
+        champ = _read_json(champion_path) or {}
         feats = champ.get("features") or champ.get("feature_names") or []
         features = len(feats) if isinstance(feats, list) else 0
         meta = champ.get("model_meta") or champ.get("model") or {}
@@ -223,7 +273,7 @@ def summarize(slug: str, inc: Dict[str, List[str]]) -> Summary:
 
     # proposals count
     proposals_csv = _first_match(inc["optimization"], suffix="_proposals.csv")
-    proposals_count = _csv_count_rows(Path(proposals_csv)) if proposals_csv else 0
+    proposals_count = _csv_count_rows(proposals_csv) if proposals_csv else 0
 
     # feasibility ladder heuristic (MVP)
     ladder = "L0" if (proposals_count and proposals_count > 0) else "L4"
@@ -243,14 +293,22 @@ def compute_fingerprints(inc: Dict[str, List[str]]) -> Fingerprints:
     data_path = _find_first(inc, "_modeling_ready.csv")
     model_path = _find_first(inc, "_champion_bundle.json")
 
-    data_hash = _sha256_file(Path(data_path)) if data_path else None
-    model_hash = _sha256_file(Path(model_path)) if model_path else None
+    # hash every included file once; hashlib releases the GIL, so threads overlap the I/O
+    all_files = sorted({p for lst in inc.values() for p in lst})
+    if len(all_files) > 1:
+        workers = min(_HASH_WORKERS, len(all_files))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            hashes = dict(zip(all_files, pool.map(_sha256_file, all_files)))
+    else:
+        hashes = {p: _sha256_file(p) for p in all_files}
+
+    data_hash = hashes.get(data_path) if data_path else None
+    model_hash = hashes.get(model_path) if model_path else None
 
     # aggregate hash across *all* included files (sorted names)
-    all_files = sorted({p for lst in inc.values() for p in lst})
     h = hashlib.sha256()
     for p in all_files:
-        ph = _sha256_file(Path(p))
+        ph = hashes[p]
         if ph:
             h.update(ph.encode("utf-8"))
     bundle_hash = h.hexdigest() if all_files else None
@@ -314,9 +372,10 @@ def write_outputs(slug: str, artifacts_dir: Path, bundle: Dict, hitl_notes: Opti
     bundle_path.write_text(json.dumps(bundle, indent=2), encoding="utf-8")
 
     # append legacy handoff log entry (JSON Lines)
+    ts_utc, ts_local = _now_iso_pair()
     entry = {
-        "ts_utc": _now_iso_utc(),
-        "ts_local": _now_iso_local(),
+        "ts_utc": ts_utc,
+        "ts_local": ts_local,
         "action": "export_handoff",
         "slug": slug,
         "status": bundle.get("status", ""),
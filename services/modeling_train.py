@@ -7,22 +7,23 @@ Version: v1.1 (2025-09-02)  << patch: exclude group_key from features; gpr_max_r
 from __future__ import annotations
 from typing import Dict, List, Optional, Tuple, Iterable, Any
 from time import perf_counter
+from functools import lru_cache
+from pathlib import Path
+import json
 import numpy as np
 import pandas as pd
-from sklearn.model_selection import KFold, GroupKFold, train_test_split
-from sklearn.metrics import r2_score, mean_squared_error, mean_absolute_error
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler
-from sklearn.gaussian_process import GaussianProcessRegressor
-from sklearn.gaussian_process.kernels import RBF, WhiteKernel
-
-try:
-    from xgboost import XGBRegressor  # type: ignore
-    _HAS_XGB = True
-except Exception:  # pragma: no cover
-    XGBRegressor = None  # type: ignore
-    _HAS_XGB = False
+
+# sklearn (~0.8s) is imported inside the functions that fit or score models, so
+# importing this module (recompute_modeling, test collection) stays cheap.
+
+@lru_cache(maxsize=1)
+def _xgb_regressor() -> Any:
+    """XGBRegressor class, imported on first use (xgboost adds ~0.5s to cold start); None if unavailable."""
+    try:
+        from xgboost import XGBRegressor  # type: ignore
+        return XGBRegressor
+    except Exception:  # pragma: no cover
+        return None
 
 
 def _select_features(
@@ -61,16 +62,22 @@ def _build_estimators(
 ) -> Dict[str, Any]:
     ests: Dict[str, Any] = {}
     if enable_rf:
+        from sklearn.ensemble import RandomForestRegressor
         ests["rf"] = RandomForestRegressor(
             n_estimators=200, max_depth=None, random_state=random_state, n_jobs=-1
         )
-    if enable_xgb and _HAS_XGB:
+    XGBRegressor = _xgb_regressor() if enable_xgb else None
+    if XGBRegressor is not None:
         ests["xgb"] = XGBRegressor(
             n_estimators=200, max_depth=6, learning_rate=0.1,
             subsample=0.8, colsample_bytree=0.8, random_state=random_state,
             n_jobs=-1, tree_method="hist",
         )
     if enable_gpr:
+        from sklearn.pipeline import Pipeline
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.gaussian_process import GaussianProcessRegressor
+        from sklearn.gaussian_process.kernels import RBF, WhiteKernel
         kernel = RBF(length_scale=1.0) + WhiteKernel(noise_level=1e-3)
         gpr = Pipeline([
             ("scaler", StandardScaler(with_mean=True, with_std=True)),
@@ -110,6 +117,9 @@ def _score_model(
     else:
         estimator = model_spec
 
+    from sklearn.model_selection import KFold, GroupKFold, train_test_split
+    from sklearn.metrics import r2_score, mean_squared_error, mean_absolute_error
+
     r2s: List[float] = []; rmses: List[float] = []; maes: List[float] = []
     strategy = (strategy or "kfold").lower()
 
@@ -237,16 +247,14 @@ def recompute_modeling(session_slug: str, modeling_ready_path: str, settings: Di
     Minimal recompute: write model_compare.csv (empty header if needed) and champion_bundle.json stub.
     Uses artifacts writer to attach schema_version; forwards fingerprints from datacard if present.
     """
-    from pathlib import Path
-    import json
     from services import artifacts as _art
-    import pandas as pd  # local import
 
     sdir = Path("artifacts") / session_slug
     sdir.mkdir(parents=True, exist_ok=True)
 
     try:
-        pd.read_csv(modeling_ready_path)
+        # readability probe only: parse the header, not every row
+        pd.read_csv(modeling_ready_path, nrows=0)
     except Exception:
         pass
 
@@ -113,29 +113,28 @@ def build_pool(space: Dict[str, Any], n_pool: int, seed: int | None = None) -> L
     # ---- LHS for numeric block ----
     num_samples = _sample_numeric_lhs(num_lows, num_highs, num_steps, n_pool, rng) if num_feats else np.zeros((n_pool, 0))
 
-    # ---- Uniform categorical draws ----
-    cat_samples = _sample_categorical(cat_domains, n_pool, rng) if cat_feats else [[] for _ in range(n_pool)]
-
-    # ---- Stitch numeric + categorical into dict rows ----
-    rows: List[Dict[str, Any]] = []
-    seen = set()
-    for i in range(n_pool):
-        row = {}
-        # numeric
-        for j, f in enumerate(num_feats):
-            row[f] = float(num_samples[i, j])
-        # categorical
-        if cat_feats:
-            for j, f in enumerate(cat_feats):
-                row[f] = cat_samples[i][j]
-        # Deduplicate (tuples are hashable)
-        key = tuple((k, row[k]) for k in sorted(row.keys()))
-        if key in seen:
-            continue
-        seen.add(key)
-        rows.append(row)
-        if len(rows) >= n_pool:
-            break
+    # ---- Uniform categorical draws (as integer codes into each domain) ----
+    cat_codes = _sample_categorical(cat_domains, n_pool, rng)
+
+    # ---- Deduplicate column-wise (first occurrence wins, draw order kept) ----
+    # Codes are canonicalized so repeated values inside a domain compare equal, as dict rows would.
+    canon = np.empty_like(cat_codes)
+    for j, dom in enumerate(cat_domains):
+        first: Dict[Any, int] = {}
+        lut = np.array([first.setdefault(v, i) for i, v in enumerate(dom)], dtype=np.int64)
+        canon[:, j] = lut[cat_codes[:, j]]
+    key = np.hstack([num_samples, canon.astype(float)])
+    if n_pool <= 0 or key.shape[1] == 0:
+        keep = np.arange(min(max(n_pool, 0), 1))
+    else:
+        keep = np.sort(np.unique(key, axis=0, return_index=True)[1])
+
+    # ---- Materialize dict rows for survivors only (column-wise lookups, one zip per row) ----
+    cols: List[List[Any]] = num_samples[keep].T.tolist()
+    for j, dom in enumerate(cat_domains):
+        cols.append([dom[c] for c in cat_codes[keep, j].tolist()])
+    feats = num_feats + cat_feats
+    rows: List[Dict[str, Any]] = [dict(zip(feats, vals)) for vals in zip(*cols)] if feats else [{} for _ in keep]
 
     return rows
 
@@ -162,37 +161,34 @@ def _sample_numeric_lhs(lows: List[float], highs: List[float], steps: List[float
         rng.shuffle(strata[:, j])
 
     # Scale to bounds
-    bounds = np.array([lows, highs])  # shape (2, d)
-    scaled = bounds[0] + strata * (bounds[1] - bounds[0])
-
-    # Snap to step grid if provided
-    out = np.empty_like(scaled)
-    for j in range(d):
-        step = steps[j]
-        if step is None or step <= 0:
-            out[:, j] = scaled[:, j]
-        else:
-            # snap to nearest multiple of step from low
-            off = (scaled[:, j] - lows[j]) / step
-            out[:, j] = lows[j] + np.round(off) * step
-            # clamp to [low, high]
-            out[:, j] = np.clip(out[:, j], lows[j], highs[j])
-
-    return out
-
-
-def _sample_categorical(domains: List[List[Any]], n: int, rng: np.random.Generator) -> List[List[Any]]:
+    lo = np.asarray(lows, dtype=float)
+    hi = np.asarray(highs, dtype=float)
+    scaled = lo + strata * (hi - lo)
+
+    # Snap to step grid if provided: one masked array op over all stepped columns
+    st = np.array([np.nan if s is None else s for s in steps], dtype=float)
+    snap = st > 0  # False for None/NaN/non-positive steps
+    if not snap.any():
+        return scaled
+    # nearest multiple of step from low, clamped to [low, high]
+    snapped = np.clip(lo[snap] + np.round((scaled[:, snap] - lo[snap]) / st[snap]) * st[snap], lo[snap], hi[snap])
+    scaled[:, snap] = snapped
+    return scaled
+
+
+def _sample_categorical(domains: List[List[Any]], n: int, rng: np.random.Generator) -> np.ndarray:
     """
-    Draw n categorical tuples uniformly over each feature domain.
+    Draw n categorical tuples uniformly over each feature domain, as integer codes.
+
+    Returns
+    -------
+    np.ndarray of shape (n, len(domains)); entry [i, j] indexes domains[j].
+    Same RNG stream as drawing rng.integers(0, len(domain)) row by row.
     """
     if not domains:
-        return [[] for _ in range(n)]
-    d = len(domains)
-    out = []
-    for _ in range(n):
-        tup = [domains[j][rng.integers(0, len(domains[j]))] for j in range(d)]
-        out.append(tup)
-    return out
+        return np.zeros((n, 0), dtype=np.int64)
+    sizes = np.array([len(dom) for dom in domains], dtype=np.int64)
+    return rng.integers(0, sizes, size=(n, len(domains)))
 
 
 def distance_gower(A: List[Dict[str, Any]], B: List[Dict[str, Any]], meta: Dict[str, Any]) -> np.ndarray:
@@ -231,33 +227,46 @@ def distance_gower(A: List[Dict[str, Any]], B: List[Dict[str, Any]], meta: Dict[
         den.append(0.0 if (r is None or r == 0.0) else r)
     den = np.array(den, dtype=float) if den else np.array([], dtype=float)
 
-    for i in range(aN):
-        for j in range(bN):
-            s = 0.0
-            m = 0  # number of features compared
-            # numeric
-            for k, f in enumerate(num_feats):
-                ai = A[i].get(f)
-                bj = B[j].get(f)
-                if ai is None or bj is None:
-                    continue
-                if den.size == 0:
-                    continue
-                if den[k] == 0.0:
-                    diff = 0.0
-                else:
-                    diff = abs(float(ai) - float(bj)) / den[k]
-                s += diff
-                m += 1
-            # categorical
-            for f in cat_feats:
-                ai = A[i].get(f)
-                bj = B[j].get(f)
-                if ai is None or bj is None:
-                    continue
-                s += 0.0 if ai == bj else 1.0
-                m += 1
-            D[i, j] = (s / m) if m > 0 else 0.0
+    if aN == 0 or bN == 0:
+        return D
+
+    # Column-wise over features: each step is one (aN x bN) broadcast, not aN*bN Python pair visits.
+    # Accumulating in feature order keeps the per-pair sums bit-identical to the scalar loop.
+    def _column(rows: List[Dict[str, Any]], f: str) -> Tuple[List[Any], np.ndarray]:
+        vals = [r.get(f) for r in rows]
+        return vals, np.fromiter((v is not None for v in vals), dtype=bool, count=len(vals))
+
+    s = np.zeros((aN, bN), dtype=float)
+    m = np.zeros((aN, bN), dtype=float)  # number of features compared per pair
+
+    # numeric
+    for k, f in enumerate(num_feats):
+        a_vals, a_ok = _column(A, f)
+        b_vals, b_ok = _column(B, f)
+        both = a_ok[:, None] & b_ok[None, :]
+        if den[k] != 0.0:
+            a = np.array([float(v) if v is not None else 0.0 for v in a_vals])
+            b = np.array([float(v) if v is not None else 0.0 for v in b_vals])
+            diff = np.abs(a[:, None] - b[None, :]) / den[k]
+            s += np.where(both, diff, 0.0)
+        m += both
+
+    # categorical
+    for f in cat_feats:
+        a_vals, a_ok = _column(A, f)
+        b_vals, b_ok = _column(B, f)
+        both = a_ok[:, None] & b_ok[None, :]
+        try:
+            codes: Dict[Any, int] = {}
+            a = np.array([codes.setdefault(v, len(codes)) for v in a_vals])
+            b = np.array([codes.setdefault(v, len(codes)) for v in b_vals])
+            neq = a[:, None] != b[None, :]
+        except TypeError:  # unhashable values: compare pairwise
+            neq = np.array([[ai != bj for bj in b_vals] for ai in a_vals], dtype=bool)
+        s += np.where(both & neq, 1.0, 0.0)
+        m += both
+
+    np.divide(s, m, out=D, where=m > 0)
 
     return D
 
@@ -44,7 +44,6 @@ from __future__ import annotations
 from typing import Dict, Any, Tuple, List, Optional, Set
 import math
 import re
-import copy
 
 
 # ---------------------------
@@ -87,6 +86,11 @@ def _is_categorical_dtype(col_profile: Dict[str, Any]) -> bool:
     return False
 
 
+def _copy_specs(specs: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Copy {feat: {key: scalar|list}} specs; same isolation as deepcopy for this shape, without its memo walk."""
+    return {f: {k: (list(v) if isinstance(v, list) else v) for k, v in spec.items()} for f, spec in specs.items()}
+
+
 # ---------------------------
 # Public API (≤5 functions)
 # ---------------------------
@@ -293,8 +297,8 @@ def apply_constraints(space: Dict[str, Any],
 
     Returns a pruned `search_space` dict with same shape as `infer_space_from_roles(...)`.
     """
-    numeric = copy.deepcopy(space.get("numeric", {}))
-    categorical = copy.deepcopy(space.get("categorical", {}))
+    numeric = _copy_specs(space.get("numeric", {}))
+    categorical = _copy_specs(space.get("categorical", {}))
     excluded = list(space.get("excluded", []))
 
     cnum = constraints.get("numeric", {})
@@ -13,11 +13,21 @@ Public functions are intentionally small so other modules can delegate without c
 
 from __future__ import annotations
 from typing import Any, Dict, List, Sequence, Tuple
+import math
 import numpy as np
 
 # We proxy distance through the pool module to keep one canonical implementation.
 from services.opt_candidate_pool import distance_gower as _distance_gower  # type: ignore[attr-defined]
 
+# Resolve a vectorized erf once at import rather than on every scoring call.
+try:
+    from scipy.special import erf as _erf  # C ufunc; scipy ships with scikit-learn
+except Exception:  # pragma: no cover
+    _erf = getattr(np, "erf", None) or np.vectorize(math.erf)
+
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
 
 # ---------------------------
 # Acquisition scoring
@@ -36,47 +46,45 @@ def score_acquisition(acq: str,
     PI : Phi(z)
 
     Handles sigma==0 safely (EI reduces to max(mu-y_best,0), PI=1 if mu>y_best else 0).
+    float32 mu/sigma are scored in float32 (half the memory traffic); anything else in float64.
     """
     acq = (acq or "").upper()
-    mu = np.asarray(mu, dtype=float).reshape(-1)
-    sigma = np.asarray(sigma, dtype=float).reshape(-1)
+    mu = np.asarray(mu)
+    sigma = np.asarray(sigma)
+    dt = np.float32 if (mu.dtype == np.float32 and sigma.dtype == np.float32) else np.float64
+    mu = np.ascontiguousarray(mu, dtype=dt).reshape(-1)
+    sigma = np.ascontiguousarray(sigma, dtype=dt).reshape(-1)
     n = mu.size
 
     if acq not in ("QEI", "EI", "UCB", "PI"):
         raise ValueError(f"Unknown acquisition '{acq}'")
 
-    # robust normal cdf/pdf
-    try:
-        erf = np.erf  # type: ignore[attr-defined]
-    except AttributeError:
-        import math
-        erf = np.vectorize(math.erf)
-
-    def Phi(z: np.ndarray) -> np.ndarray:
-        return 0.5 * (1.0 + erf(z / np.sqrt(2.0)))
+    if acq == "UCB":
+        return mu + float(ucb_k) * sigma
 
-    def phi(z: np.ndarray) -> np.ndarray:
-        return (1.0 / np.sqrt(2.0 * np.pi)) * np.exp(-0.5 * z * z)
-
-    out = np.empty(n, dtype=float)
+    # Full-length arithmetic with a safe divisor instead of boolean-masked copies of every
+    # operand; σ==0 lanes are patched with np.where at the end. Temporaries are reused in place.
     pos = sigma > 0
-    z = np.zeros_like(mu)
-    z[pos] = (mu[pos] - y_best) / sigma[pos]
+    imp = mu - float(y_best)
+    z = np.divide(imp, sigma, out=np.zeros(n, dtype=dt), where=pos)
+
+    # robust normal cdf: Φ(z) = 0.5 * (1 + erf(z / √2))
+    cdf = _erf(z * _INV_SQRT2)
+    cdf += 1.0
+    cdf *= 0.5
 
-    if acq in ("EI", "QEI"):
-        ei = np.zeros_like(mu)
-        ei[pos] = (mu[pos] - y_best) * Phi(z[pos]) + sigma[pos] * phi(z[pos])
-        ei[~pos] = np.maximum(mu[~pos] - y_best, 0.0)
-        out = ei
-    elif acq == "UCB":
-        out = mu + float(ucb_k) * sigma
-    elif acq == "PI":
-        pi = np.zeros_like(mu)
-        pi[pos] = Phi(z[pos])
-        pi[~pos] = (mu[~pos] > y_best).astype(float)
-        out = pi
+    if acq == "PI":
+        return np.where(pos, cdf, (imp > 0).astype(dt))
 
-    return out
+    # EI (and qEI scored per point): imp * Φ(z) + σ * φ(z)
+    pdf = np.square(z)
+    pdf *= -0.5
+    np.exp(pdf, out=pdf)
+    pdf *= _INV_SQRT_2PI
+    pdf *= sigma
+    cdf *= imp
+    cdf += pdf
+    return np.where(pos, cdf, np.maximum(imp, 0.0))
 
 
 # ---------------------------
@@ -110,13 +118,20 @@ def select_batch_greedy_maxmin(pool: List[Dict[str, Any]],
         return []
     k = min(k, n)
 
-    idx_sorted = np.argsort(-scores)
-    selected: List[int] = [int(idx_sorted[0])]
+    # Only the top-1 is needed: O(n) nanargmax instead of a full argsort (NaN scores rank last)
+    scores = np.asarray(scores, dtype=float)
+    try:
+        first = int(np.nanargmax(scores))
+    except ValueError:  # all-NaN scores
+        first = 0
+    selected: List[int] = [first]
 
     if k == 1 or diversity_meta is None:
         return selected
 
-    D_all = distance_gower(pool, pool, diversity_meta)
+    # Running min distance to the selected set: one (n x 1) Gower column per pick
+    # instead of the full (n x n) matrix; the greedy choice is identical.
+    min_to_sel = distance_gower(pool, [pool[selected[0]]], diversity_meta)[:, 0]
 
     while len(selected) < k:
         mask = np.ones(n, dtype=bool)
@@ -125,7 +140,7 @@ def select_batch_greedy_maxmin(pool: List[Dict[str, Any]],
         if candidates.size == 0:
             break
 
-        min_d = np.min(D_all[candidates][:, selected], axis=1)
+        min_d = min_to_sel[candidates]
         # best by distance; if tie, prefer better score
         best_idx = int(candidates[np.argmax(min_d)])
         # tie-break
@@ -133,5 +148,7 @@ def select_batch_greedy_maxmin(pool: List[Dict[str, Any]],
         if ties.size > 1:
             best_idx = int(candidates[ties[np.argmax(scores[candidates[ties]])]])
         selected.append(best_idx)
+        if len(selected) < k:
+            np.minimum(min_to_sel, distance_gower(pool, [pool[best_idx]], diversity_meta)[:, 0], out=min_to_sel)
 
     return selected
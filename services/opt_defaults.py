@@ -5,9 +5,9 @@ Default settings and minimal recompute helper for Screen 5.
 """
 
 from __future__ import annotations
+import os
 from typing import Dict, Any, List
 from pathlib import Path
-import pandas as pd
 from services import artifacts as _art
 
 
@@ -21,24 +21,43 @@ def get_default_settings() -> Dict[str, Any]:
     }
 
 
+def _unchanged(path: Path, data: bytes) -> bool:
+    """True when `path` already holds exactly `data` (size check first, then bytes)."""
+    try:
+        return path.stat().st_size == len(data) and path.read_bytes() == data
+    except OSError:
+        return False
+
+
 def recompute_optimization(session_slug: str, settings: Dict[str, Any] | None = None) -> Dict[str, List[Dict[str, str]]]:
     """
     Minimal recompute: write optimization_settings.json, proposals.csv (empty), and optimization_trace.json stub.
     Uses artifacts writer to attach schema_version.
+    Files whose content would not change are left untouched (idempotent reruns skip the writes).
     """
     sdir = Path("artifacts") / session_slug
     sdir.mkdir(parents=True, exist_ok=True)
 
     opt_settings = settings or get_default_settings()
     settings_path = sdir / "optimization_settings.json"
-    _art.save_json(opt_settings, f"{session_slug}_optimization_settings.json")
+    settings_bytes = _art.dump_json_bytes(opt_settings)
+    # Compare against where save_json_bytes actually writes (safe_path splits on the first "_")
+    settings_name = f"{session_slug}_optimization_settings.json"
+    if not _unchanged(_art.safe_path(settings_name), settings_bytes):
+        _art.save_json_bytes(settings_bytes, settings_name)
 
     proposals_path = sdir / "proposals.csv"
-    pd.DataFrame([]).to_csv(proposals_path, index=False)
+    # Empty placeholder: the exact bytes pd.DataFrame([]).to_csv(index=False) produced, minus the pandas round-trip
+    placeholder = os.linesep.encode("ascii")
+    if not _unchanged(proposals_path, placeholder):
+        proposals_path.write_bytes(placeholder)
 
     trace = {"steps": []}
     trace_path = sdir / "optimization_trace.json"
-    _art.save_json(trace, f"{session_slug}_optimization_trace.json")
+    trace_bytes = _art.dump_json_bytes(trace)
+    trace_name = f"{session_slug}_optimization_trace.json"
+    if not _unchanged(_art.safe_path(trace_name), trace_bytes):
+        _art.save_json_bytes(trace_bytes, trace_name)
 
     return {
         "written": [
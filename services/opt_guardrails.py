@@ -47,26 +47,31 @@ def apply_safety_filter(mu: np.ndarray,
     keep_mask : np.ndarray[bool]   (length n)
     safety_blocked : int
     """
-    mu = np.asarray(mu).reshape(-1)
-    sigma = np.asarray(sigma).reshape(-1)
+    mu = np.asarray(mu, dtype=float).reshape(-1)
+    sigma = np.asarray(sigma, dtype=float).reshape(-1)
     n = mu.size
-    keep = np.ones(n, dtype=bool)
 
+    # Each branch fills one preallocated mask in place (no per-condition temporaries).
     if mode == "deterministic":
         low = (abs_limits or {}).get("low", None)
         high = (abs_limits or {}).get("high", None)
+        keep = np.ones(n, dtype=bool)
         if low is not None:
-            keep &= mu >= float(low)
+            np.greater_equal(mu, float(low), out=keep)
         if high is not None:
-            keep &= mu <= float(high)
+            if low is None:
+                np.less_equal(mu, float(high), out=keep)
+            else:
+                keep &= mu <= float(high)
     else:
         med = float(np.median(mu)) if n else 0.0
-        band = float(k)
-        # keep if |μ - median| <= band * σ  (σ==0 → allow only if μ==median)
-        tol = band * sigma
-        keep &= np.abs(mu - med) <= tol
+        # keep if |μ - median| <= k * σ  (σ==0 → allow only if μ==median)
+        dev = np.subtract(mu, med)
+        np.abs(dev, out=dev)
+        tol = np.multiply(sigma, float(k))
+        keep = np.less_equal(dev, tol)
 
-    return keep, int((~keep).sum())
+    return keep, n - int(np.count_nonzero(keep))
 
 
 def apply_novelty_filter(pool: List[Dict[str, Any]],
@@ -89,7 +94,7 @@ def apply_novelty_filter(pool: List[Dict[str, Any]],
     D = distance_gower(pool, training_X, meta)  # shape (n, m)
     min_to_train = np.min(D, axis=1) if D.size else np.ones(n, dtype=float)
     keep = min_to_train >= float(eps)
-    return keep, int((~keep).sum())
+    return keep, n - int(np.count_nonzero(keep))
 
 
 def summarize_diversity(pool: List[Dict[str, Any]],
@@ -19,6 +19,10 @@ from typing import Dict, Any, Tuple
 ACQUISITIONS = {"qEI", "EI", "UCB", "PI"}
 UNCERTAINTY_MODES = {"native", "approx_rf", "deterministic"}
 
+# Case-folded views, built once rather than on every normalize_settings call
+_ACQUISITIONS_UPPER = frozenset(a.upper() for a in ACQUISITIONS)
+_UNCERTAINTY_MODES_LOWER = frozenset(m.lower() for m in UNCERTAINTY_MODES)
+
 
 # ---- Public helpers ----
 
@@ -55,23 +59,24 @@ def normalize_settings(settings: Dict[str, Any]) -> Tuple[Dict[str, Any], list[s
 
     # acquisition
     acq_raw = str(out.get("acquisition", "")).strip()
-    acq_upper = acq_raw.upper() if acq_raw else ""
-    if acq_upper not in {a.upper() for a in ACQUISITIONS}:
+    acq_upper = acq_raw.upper()
+    if acq_upper not in _ACQUISITIONS_UPPER:
         raise ValueError(f"[opt_registry] Unknown acquisition '{acq_raw}'. Allowed: {sorted(ACQUISITIONS)}")
     out["acquisition"] = acq_raw if acq_raw in ACQUISITIONS else acq_upper if acq_upper in ACQUISITIONS else acq_raw
     # scoring alias
-    out["acquisition_for_scoring"] = "EI" if acq_upper == "QEI" else acq_upper
+    acq_scoring = "EI" if acq_upper == "QEI" else acq_upper
+    out["acquisition_for_scoring"] = acq_scoring
 
     # uncertainty
     um_raw = str(out.get("uncertainty_mode", "")).strip()
-    um_lower = um_raw.lower() if um_raw else ""
-    if um_lower not in {m.lower() for m in UNCERTAINTY_MODES}:
+    um_lower = um_raw.lower()
+    if um_lower not in _UNCERTAINTY_MODES_LOWER:
         raise ValueError(f"[opt_registry] Unknown uncertainty_mode '{um_raw}'. Allowed: {sorted(UNCERTAINTY_MODES)}")
     out["uncertainty_mode"] = um_raw if um_raw in UNCERTAINTY_MODES else um_lower
 
     # ucb_k
     ucb_k = out.get("ucb_k", None)
-    if out["acquisition_for_scoring"] == "UCB":
+    if acq_scoring == "UCB":
         try:
             if float(ucb_k) <= 0:
                 raise ValueError  # handled below
@@ -80,9 +85,7 @@ def normalize_settings(settings: Dict[str, Any]) -> Tuple[Dict[str, Any], list[s
     else:
         # Not used; keep but warn if provided and weird
         try:
-            if ucb_k is None:
-                pass
-            else:
+            if ucb_k is not None:
                 float(ucb_k)  # sanity parse
         except Exception:
             warnings.append("`ucb_k` ignored for non-UCB acquisition.")
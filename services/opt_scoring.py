@@ -71,12 +71,13 @@ def predict_mu_sigma(model: Any,
             pass  # fall back to approx
 
     # Lightweight approximation of σ based on spread around the median of μ
+    # (np.median selects via partition, O(n); the deviations are built once and scaled in place)
     med = float(np.median(mu))
     sigma = np.abs(mu - med)
-    mad = float(np.median(np.abs(mu - med))) or approx_epsilon
-    sigma = sigma / mad
+    mad = float(np.median(sigma)) or approx_epsilon
     s = float(np.std(mu)) or 1.0
-    sigma = np.maximum(sigma * (0.25 * s), approx_epsilon)
+    sigma *= (0.25 * s) / mad
+    np.maximum(sigma, approx_epsilon, out=sigma)
     return mu, sigma
 
 
@@ -38,7 +38,7 @@ from __future__ import annotations
 from typing import Dict, Iterable, List, Literal, Tuple
 
 import pandas as pd
-import json, hashlib
+import io, json, hashlib
 from pathlib import Path
 
 from services import artifacts as _art
@@ -181,10 +181,8 @@ def execute_collapse(
             cols = [c for c, m in modes.items() if m == "last_by:sample"]
             pieces.append(idx[cols])
         if any(m == "last_by:max_self" for m in modes.values()):
-            # Per-feature max within group (fallback)
-            def _max_self(s: pd.Series) -> float:
-                return s.max()  # ok for numeric counters
-            maxdf = g[ [c for c, m in modes.items() if m == "last_by:max_self"] ].agg(_max_self)
+            # Per-feature max within group (fallback); cythonized groupby max, no per-group Python call
+            maxdf = g[ [c for c, m in modes.items() if m == "last_by:max_self"] ].max()
             pieces.append(maxdf)
 
         # Align/join all usage pieces on grouping index
@@ -278,13 +276,16 @@ def recompute_roles_and_datacard(
     sdir = Path("artifacts") / session_slug
     sdir.mkdir(parents=True, exist_ok=True)
 
+    # Read the merged CSV once: the same bytes feed the parser and the dataset fingerprint
+    merged_bytes = Path(merged_csv_path).read_bytes()
+
     # 1) modeling_ready.csv (pass-through from merged)
-    df = pd.read_csv(merged_csv_path)
+    df = pd.read_csv(io.BytesIO(merged_bytes))
     ready_path = sdir / "modeling_ready.csv"
     df.to_csv(ready_path, index=False)
 
     # 2) datacard.json with fingerprints
-    h = hashlib.sha256(); h.update(Path(merged_csv_path).read_bytes()); dataset_hash = h.hexdigest()
+    dataset_hash = hashlib.sha256(merged_bytes).hexdigest()
     roles_signature = hashlib.sha256(json.dumps({"roles_map": roles_map or {}, "collapse": collapse_spec or {}}, sort_keys=True).encode("utf-8")).hexdigest()
     datacard = {
         "roles_map": roles_map or {},
@@ -8,6 +8,7 @@ Non-UI, pure functions used by screens to soft-block when artifacts are stale.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 import hashlib
@@ -16,23 +17,42 @@ import json
 from constants import SCHEMA_VERSION
 
 
-def _read_json(p: Path) -> Optional[dict]:
+@lru_cache(maxsize=64)
+def _read_json_cached(path: str, size: int, mtime_ns: int) -> Optional[dict]:
     try:
-        return json.loads(p.read_text(encoding="utf-8")) if p.exists() else None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
     except Exception:
         return None
 
 
-def _sha256_file(p: Path) -> Optional[str]:
-    if not p.exists() or not p.is_file():
+def _read_json(p: Path) -> Optional[dict]:
+    """Parsed JSON memoized on (path, size, mtime); callers must not mutate the result."""
+    try:
+        st = p.stat()
+    except OSError:
         return None
+    return _read_json_cached(str(p.resolve()), st.st_size, st.st_mtime_ns)
+
+
+@lru_cache(maxsize=64)
+def _sha256_cached(path: str, size: int, mtime_ns: int) -> str:
+    # size/mtime_ns are part of the key only: any rewrite of the file busts the entry
     h = hashlib.sha256()
-    with p.open("rb") as f:
+    with open(path, "rb") as f:
         for chunk in iter(lambda: f.read(1024 * 1024), b""):
             h.update(chunk)
     return h.hexdigest()
 
 
+def _sha256_file(p: Path) -> Optional[str]:
+    """Content hash, memoized on (path, size, mtime) so reruns skip re-reading unchanged files."""
+    if not p.exists() or not p.is_file():
+        return None
+    st = p.stat()
+    return _sha256_cached(str(p.resolve()), st.st_size, st.st_mtime_ns)
+
+
 def autoload_latest_artifacts(session_slug: str) -> Dict[str, Any]:
     """Discover latest artifacts for a slug and compute upstream/current metadata.
 
@@ -49,7 +49,8 @@ def _cleanup_artifacts(slug: str):
             except Exception:
                 pass
 
-def test_screen5_autorun_ack_guardrails_and_artifacts(monkeypatch):
+def test_screen5_autorun_ack_guardrails_and_artifacts(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # S5 writes to ./artifacts
     _cleanup_artifacts(SLUG)
 
     # Set env fallbacks (robust under pytest)
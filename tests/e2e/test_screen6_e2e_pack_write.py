@@ -52,13 +52,14 @@ def _touch_min_s5(slug: str):
         ensure_text(slug, "screen5_log.jsonl", json.dumps({"event": "synthetic_s5"}))
 
 
-def test_screen6_end_to_end_pack_and_write(monkeypatch):
+def test_screen6_end_to_end_pack_and_write(tmp_path, monkeypatch):
     """
     E2E: generate S5 artifacts (headless), then run Screen 6:
       discover -> summarize -> compute_fingerprints -> build_bundle -> write_outputs
     Assert the Screen 6 outputs exist and contain included optimization artifacts.
     """
     slug = "s6e2e_pytest"
+    monkeypatch.chdir(tmp_path)  # S5/S6 write to ./artifacts
     _cleanup(slug)
 
     # --- Step 1: Generate S5 artifacts via headless autorun (import-time hook)
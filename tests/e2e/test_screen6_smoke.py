@@ -17,7 +17,8 @@ def _write(p: Path, s: str):
 def _csv(p: Path, header, rows):
     _write(p, ",".join(header) + "\n" + "\n".join([",".join(map(str, r)) for r in rows]))
 
-def test_e2e_happy(tmp_path: Path):
+def test_e2e_happy(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # screen6_log.jsonl goes to ./artifacts
     artifacts = tmp_path / "artifacts"
     slug = "250902_e2e"
     # create a minimally complete set
@@ -44,7 +45,8 @@ def test_e2e_happy(tmp_path: Path):
     bpath, lpath = write_outputs(slug, artifacts, bundle)
     assert bpath.exists() and lpath.exists()
 
-def test_e2e_partial(tmp_path: Path):
+def test_e2e_partial(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # screen6_log.jsonl goes to ./artifacts
     artifacts = tmp_path / "artifacts"
     slug = "250902_e2e_partial"
     # omit proposals
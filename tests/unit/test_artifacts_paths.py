@@ -1,6 +1,6 @@
 
 from pathlib import Path
-from services.artifacts import safe_path, save_json, save_csv
+from services.artifacts import safe_path, save_json, save_csv, dump_json_bytes, save_json_bytes
 import pandas as pd
 
 def test_safe_path_under_artifacts(tmp_path):
@@ -18,3 +18,16 @@ def test_save_json_and_csv(tmp_path):
     # extra OS-agnostic checks
     assert jp.parent == (tmp_path / "artifacts")
     assert cp.parent == (tmp_path / "artifacts")
+
+def test_save_json_bytes_matches_save_json(tmp_path):
+    payload = {"b": [1, 2.5], "a": "µ"}
+    jp = save_json(payload, "one.json", root=tmp_path)
+    bp = save_json_bytes(dump_json_bytes(payload), "two.json", root=tmp_path)
+    assert jp.read_bytes() == bp.read_bytes()
+
+def test_load_json_roundtrips_nan_and_unicode(tmp_path):
+    import math
+    from services.artifacts import load_json
+    save_json({"x": float("nan"), "a": "µ"}, "nan.json", root=tmp_path)
+    back = load_json("nan.json", root=tmp_path)
+    assert math.isnan(back["x"]) and back["a"] == "µ"
@@ -0,0 +1,49 @@
+import io
+
+import pandas as pd
+import pytest
+
+from services import file_io
+from services.file_io import read_csv_lite
+
+CASES = {
+    "mixed": "a,b,c,d\n1,x,1.5,True\n2,,NA,False\n,NA,2.25,\n",
+    "empty_column": "a,b\n1,\n2,\n",
+    "dates_stay_text": "d,t,x\n2024-01-01,2024-01-01 10:00:00,1\n2024-02-01,2024-02-01 11:30:00,2\n",
+    "duplicate_and_blank_headers": "a,a,\n1,2,3\n4,5,6\n",
+    "na_spellings": "s,n\nnull,1\nN/A,nan\nok,None\n",
+    "bool_with_missing": "f\nTrue\n\nfalse\n",
+    "beyond_int64": "u,i\n18446744073709551615,99999999999999999999\n1,2\n",
+}
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_read_csv_lite_matches_pandas(name):
+    text = CASES[name]
+    expected = pd.read_csv(io.StringIO(text))
+    pd.testing.assert_frame_equal(read_csv_lite(text.encode("utf-8")), expected)
+    pd.testing.assert_frame_equal(read_csv_lite(io.BytesIO(text.encode("utf-8"))), expected)
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_read_csv_lite_arrow_path_matches_pandas(name):
+    if file_io._pacsv is None:
+        pytest.skip("pyarrow is not importable here")
+    text = CASES[name]
+    expected = pd.read_csv(io.StringIO(text))
+    try:
+        got = file_io._read_csv_arrow(text.encode("utf-8"))
+    except ValueError:
+        # The arrow path refuses files it cannot type like pandas; read_csv_lite falls back
+        assert name in {"duplicate_and_blank_headers", "beyond_int64"}
+        return
+    pd.testing.assert_frame_equal(got, expected)
+    # Missing cells stay NaN (not None / "NA") in object columns
+    for c in [c for c, dt in got.dtypes.items() if pd.api.types.is_object_dtype(dt)]:
+        assert all(v is not None for v in got[c])
+
+
+def test_read_csv_lite_pandas_fallback_without_pyarrow(monkeypatch):
+    monkeypatch.setattr(file_io, "_pacsv", None)
+    text = CASES["mixed"]
+    pd.testing.assert_frame_equal(read_csv_lite(text.encode("utf-8")), pd.read_csv(io.StringIO(text)))
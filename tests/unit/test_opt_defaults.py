@@ -0,0 +1,31 @@
+import json
+
+from services.artifacts import safe_path
+from services.opt_defaults import get_default_settings, recompute_optimization
+
+
+def test_recompute_optimization_skips_unchanged_writes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    out = recompute_optimization("s5idem")
+    paths = [w["path"] for w in out["written"]]
+    before = {p: (tmp_path / p).stat().st_mtime_ns for p in paths}
+
+    recompute_optimization("s5idem")
+    assert {p: (tmp_path / p).stat().st_mtime_ns for p in paths} == before
+
+    settings = dict(get_default_settings(), batch_size=8)
+    recompute_optimization("s5idem", settings)
+    saved = json.loads((tmp_path / paths[0]).read_text(encoding="utf-8"))
+    assert saved["batch_size"] == 8
+
+
+def test_recompute_optimization_skips_unchanged_writes_for_underscored_slug(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    slug = "250902_idem"
+    recompute_optimization(slug)
+    # save_json_bytes routes "<slug>_<name>" through safe_path, which splits on the first "_"
+    paths = [safe_path(f"{slug}_{name}") for name in ("optimization_settings.json", "optimization_trace.json")]
+    before = {p: (p.stat().st_ino, p.stat().st_mtime_ns) for p in paths}
+
+    recompute_optimization(slug)
+    assert {p: (p.stat().st_ino, p.stat().st_mtime_ns) for p in paths} == before
@@ -68,3 +68,17 @@ def test_select_batch_diversity_greedy():
     assert len(idx) == 3
     # ensure top-1 is included and others are reasonably spread
     assert idx[0] == int(np.argmax(scores))
+
+def test_select_batch_top1_skips_nan_and_takes_first_tie():
+    pool = [{"x": float(i)} for i in range(5)]
+    scores = np.array([np.nan, 0.3, 0.9, 0.9, 0.1])
+    assert select_batch(pool, scores, k=1) == [2]
+    assert select_batch(pool, np.full(5, np.nan), k=1) == [0]
+
+def test_score_acquisition_keeps_float32_inputs():
+    mu = np.array([0.2, 0.8, 1.5, 0.1])
+    sigma = np.array([0.3, 0.0, 0.4, 0.2])
+    ref = score_acquisition("EI", mu, sigma, y_best=0.5)
+    f32 = score_acquisition("EI", mu.astype(np.float32), sigma.astype(np.float32), y_best=0.5)
+    assert ref.dtype == np.float64 and f32.dtype == np.float32
+    assert np.allclose(f32, ref, atol=1e-6)
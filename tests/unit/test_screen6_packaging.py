@@ -27,7 +27,9 @@ def _csv(p: Path, header, rows):
     _write(p, ",".join(header) + "\n" + "\n".join([",".join(map(str, r)) for r in rows]))
 
 @pytest.fixture
-def tmp_artifacts(tmp_path: Path):
+def tmp_artifacts(tmp_path: Path, monkeypatch):
+    # log_event writes under ./artifacts; keep those lines out of the repo tree
+    monkeypatch.chdir(tmp_path)
     return tmp_path / "artifacts"
 
 def test_packaging_success(tmp_artifacts: Path):
@@ -106,3 +108,53 @@ def test_packaging_partial_on_missing_proposals(tmp_artifacts: Path):
     bundle = build_bundle(slug, disc, smry, fps)
     assert bundle["status"] == "partial"
     assert any(exc["artifact"].endswith("_proposals.csv") for exc in bundle["exceptions"])
+
+def test_row_count_memo_tracks_rewrites(tmp_path: Path):
+    import os
+    from services.handoff_core import _csv_count_rows
+    p = tmp_path / "x_modeling_ready.csv"
+    _csv(p, ["a"], [[1], [2]])
+    assert _csv_count_rows(p) == 2
+    assert _csv_count_rows(p) == 2
+    _csv(p, ["a"], [[1], [2], [3]])
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert _csv_count_rows(p) == 3
+    assert _csv_count_rows(tmp_path / "missing.csv") is None
+
+def test_sha256_memo_matches_content_and_tracks_rewrites(tmp_path: Path):
+    import hashlib
+    import os
+    from services.handoff_core import _sha256_file
+    p = tmp_path / "x_champion_bundle.json"
+    _write(p, '{"a": 1}')
+    assert _sha256_file(p) == hashlib.sha256(b'{"a": 1}').hexdigest()
+    _write(p, '{"a": 2}')
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert _sha256_file(p) == hashlib.sha256(b'{"a": 2}').hexdigest()
+    assert _sha256_file(tmp_path) is None
+
+def test_write_outputs_appends_service_log(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    slug = "250902_log"
+    bundle = {"slug": slug, "exceptions": [], "versions": {"schema_version": "2.0"}}
+    bpath, _ = write_outputs(slug, tmp_path / "artifacts", bundle)
+    assert bpath.exists()
+    log = tmp_path / "artifacts" / slug / f"{slug}_screen6_log.jsonl"
+    rec = json.loads(log.read_text(encoding="utf-8").splitlines()[-1])
+    assert rec["event"] == "handoff_bundle"
+    assert rec["details"]["bytes"] == bpath.stat().st_size
+
+def test_discovery_resolves_foldered_layout_and_logs(tmp_artifacts: Path):
+    slug = "250902_folder"
+    _write(tmp_artifacts / slug / "session_setup.json", "{}")
+    _write(tmp_artifacts / slug / f"{slug}_screen2_log.jsonl", "")
+    _write(tmp_artifacts / "screen1_log.json", "")
+    disc = discover_artifacts(slug, tmp_artifacts)
+    assert disc.included["session"] == [str(tmp_artifacts / slug / "session_setup.json")]
+    assert f"{slug}_session_setup.json" not in disc.missing
+    assert disc.included["logs"] == [
+        str(tmp_artifacts / "screen1_log.json"),
+        str(tmp_artifacts / slug / f"{slug}_screen2_log.jsonl"),
+    ]
@@ -91,3 +91,37 @@ def test_autoload_schema_mismatch_hard_fail(monkeypatch, tmp_path):
     with pytest.raises(RuntimeError) as ei:
         autoload_latest_artifacts(slug)
     assert "schema_version mismatch" in str(ei.value)
+
+
+def test_autoload_rehashes_rewritten_merged(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    slug = "trehash"
+    art = tmp_path / "artifacts" / slug
+    art.mkdir(parents=True, exist_ok=True)
+    merged = art / "merged.csv"
+
+    merged.write_text("a,b\n1,2\n", encoding="utf-8")
+    first = autoload_latest_artifacts(slug)["upstream"]["dataset_hash"]
+    assert first == _sha256_path(merged)
+
+    merged.write_text("a,b\n1,2\n3,4\n", encoding="utf-8")
+    second = autoload_latest_artifacts(slug)["upstream"]["dataset_hash"]
+    assert second == _sha256_path(merged)
+    assert second != first
+
+
+def test_autoload_rereads_rewritten_datacard(monkeypatch, tmp_path):
+    import os
+    monkeypatch.chdir(tmp_path)
+    slug = "treread"
+    art = tmp_path / "artifacts" / slug
+    art.mkdir(parents=True, exist_ok=True)
+    card = art / "datacard.json"
+
+    card.write_text(json.dumps({"roles_signature": "r1"}), encoding="utf-8")
+    assert autoload_latest_artifacts(slug)["upstream"]["roles_signature"] == "r1"
+
+    card.write_text(json.dumps({"roles_signature": "r2"}), encoding="utf-8")
+    st = card.stat()
+    os.utime(card, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert autoload_latest_artifacts(slug)["upstream"]["roles_signature"] == "r2"
@@ -0,0 +1,15 @@
+"""
+tests/unit/test_utils_ui_state.py
+ensure_defaults seeds only missing session keys.
+"""
+
+import streamlit as st
+
+from utils.ui_state import ensure_defaults
+
+def test_ensure_defaults_preserves_existing():
+    st.session_state.clear()
+    st.session_state["screen_idx"] = 2
+    ensure_defaults({"screen_idx": 0, "last_error": None})
+    assert st.session_state["screen_idx"] == 2
+    assert st.session_state["last_error"] is None
@@ -17,11 +17,3 @@ Notes
 - Placeholder scaffold. Implement functions per SYSTEM_DESIGN and orchestration map.
 - Add unit tests before wiring into Streamlit screens.
 """
-
-
-# TODO: implement module contents per SYSTEM_DESIGN.md
-
-
-def TODO_helper():
-    """Placeholder helper from dataframe_ops.")"""
-    return None
@@ -2,27 +2,42 @@
 from __future__ import annotations
 import csv, json, os
 from pathlib import Path
-from datetime import datetime
 
-ART = Path("artifacts")
+from utils.runtime import env_flag, now_utc_iso
+
+try:  # optional fast serializer (native NumPy support); stdlib json stays the reference path
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    _orjson = None
 
-def _now() -> str:
-    return datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+ART = Path("artifacts")
 
 def _write_json(p: Path, obj) -> None:
+    # Machine-read outputs: compact by default, indented only with DOE_WIZARD_PRETTY_JSON=1
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(obj, indent=2), encoding="utf-8")
+    pretty = env_flag("DOE_WIZARD_PRETTY_JSON")
+    if _orjson is not None:
+        opts = _orjson.OPT_SERIALIZE_NUMPY | _orjson.OPT_NON_STR_KEYS
+        if pretty:
+            opts |= _orjson.OPT_INDENT_2
+        try:
+            p.write_bytes(_orjson.dumps(obj, option=opts))
+            return
+        except TypeError:
+            pass  # unsupported type (e.g. >64-bit int): let stdlib json decide
+    text = json.dumps(obj, indent=2) if pretty else json.dumps(obj, separators=(",", ":"))
+    p.write_text(text, encoding="utf-8")
 
 def _write_csv(p: Path, header: list[str], rows: list[list]) -> None:
     p.parent.mkdir(parents=True, exist_ok=True)
     with p.open("w", encoding="utf-8", newline="") as f:
         w = csv.writer(f); w.writerow(header); w.writerows(rows)
 
-def _append_log(slug: str, level: str, msg: str) -> None:
+def _append_log(slug: str, level: str, msg: str, ts: str | None = None) -> None:
     ART.mkdir(parents=True, exist_ok=True)
     lp = ART / f"{slug}_screen5_log.json"
     with lp.open("a", encoding="utf-8") as f:
-        f.write(json.dumps({"ts_utc": _now(), "level": level, "message": msg}) + "\n")
+        f.write(json.dumps({"ts_utc": ts or now_utc_iso(), "level": level, "message": msg}) + "\n")
 
 def ensure_s5_min_artifacts(slug: str) -> None:
     """
@@ -34,10 +49,11 @@ def ensure_s5_min_artifacts(slug: str) -> None:
     proposals = ART / f"{slug}_proposals.csv"
     trace = ART / f"{slug}_optimization_trace.json"
 
+    ts = now_utc_iso()  # one stamp per run, shared by settings, trace and log
     created = False
     if not settings.exists():
         _write_json(settings, {
-            "slug": slug, "created_utc": _now(),
+            "slug": slug, "created_utc": ts,
             "bounds": {"x1": [0.0, 1.0]},
             "strategy": {"acq": "ei", "batch_size": 2},
             "constraints": [], "notes": "Headless autorun defaults"
@@ -49,8 +65,8 @@ def ensure_s5_min_artifacts(slug: str) -> None:
     if not trace.exists():
         _write_json(trace, {
             "slug": slug,
-            "events": [{"t": _now(), "event": "proposals_generated", "count": 1}]
+            "events": [{"t": ts, "event": "proposals_generated", "count": 1}]
         })
         created = True
     if created:
-        _append_log(slug, "INFO", "ensure_s5_min_artifacts wrote missing S5 artifacts")
+        _append_log(slug, "INFO", "ensure_s5_min_artifacts wrote missing S5 artifacts", ts=ts)
@@ -9,14 +9,14 @@ Acceptance:
 """
 
 from __future__ import annotations
-import json, os, tempfile, datetime
+import json, os, datetime
 from typing import Any, Dict, Optional
 
 LOCAL_TZ = datetime.datetime.now().astimezone().tzinfo  # America/Los_Angeles via OS
 DEFAULT_LEVEL = "INFO"
 
 def _now_ts() -> tuple[str, str]:
-    now_utc = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc)
+    now_utc = datetime.datetime.now(datetime.timezone.utc)
     now_local = now_utc.astimezone(LOCAL_TZ)
     return now_utc.isoformat().replace("+00:00", "Z"), now_local.isoformat()
 
@@ -26,17 +26,10 @@ def _ensure_dir(path: str) -> None:
 def _append_jsonl(path: str, record: Dict[str, Any]) -> None:
     _ensure_dir(os.path.dirname(path))
     line = json.dumps(record, separators=(",", ":"), sort_keys=False)
-    # Append atomically
-    dirpath = os.path.dirname(path) or "."
-    with tempfile.NamedTemporaryFile("w", dir=dirpath, delete=False, encoding="utf-8") as tmp:
-        tmp.write(line + "\n")
-        tmp_path = tmp.name
-    # Atomic rename (best-effort): append by concatenation
-    # On Windows, emulate append by open+write; atomicity at file boundary isn’t guaranteed, but acceptable at MVP.
+    # One O_APPEND write of the whole line: a single open/write/close, no temp file
+    # round-trip. Short appends land whole, so concurrent writers don't interleave.
     with open(path, "a", encoding="utf-8") as f:
-        with open(tmp_path, "r", encoding="utf-8") as r:
-            f.write(r.read())
-    os.remove(tmp_path)
+        f.write(line + "\n")
 
 def _screen_log_path(session_slug: str, screen: str) -> str:
     """Canonical per-slug JSONL path: artifacts/<slug>/<slug>_screenN_log.jsonl.
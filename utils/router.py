@@ -3,8 +3,12 @@
 
 from __future__ import annotations
 import importlib
+from functools import lru_cache
 from typing import Callable
 
+# Screens are static for a process; cache so reruns skip import/getattr lookups.
+# Failed imports raise and are not cached. Call resolve_renderer.cache_clear() on dev reload.
+@lru_cache(maxsize=16)
 def resolve_renderer(module_name: str) -> Callable[[], None]:
     """
     Import the given module and return a callable to render the screen.
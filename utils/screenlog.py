@@ -36,6 +36,13 @@ def _json_sanitize(obj: Any) -> Any:
         return str(obj)
 
 
+def _build_payload(event: Dict[str, Any] | None, normalized: str) -> Dict[str, Any]:
+    # Marshalled once per event; every writer/fallback below reuses the same dict
+    payload = {k: _json_sanitize(v) for k, v in (event or {}).items()}
+    payload.setdefault("screen", normalized)
+    return payload
+
+
 def _local_append_jsonl(payload: Dict[str, Any], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("a", encoding="utf-8") as f:
@@ -55,8 +62,7 @@ def screen_log(slug: str, screen: str, event: Dict[str, Any]) -> str:
     path = ARTIFACTS_DIR / slug / f"{slug}_{normalized}_log.jsonl"
 
     # Build a safe payload and guarantee the directory exists
-    payload = {k: _json_sanitize(v) for k, v in (event or {}).items()}
-    payload.setdefault("screen", normalized)
+    payload = _build_payload(event, normalized)
     path.parent.mkdir(parents=True, exist_ok=True)
 
     # Prefer utils.uilog.write_event_jsonl, but guard against signature/behavior differences
@@ -1,6 +1,6 @@
 # utils/ui_state.py
 from __future__ import annotations
-from typing import Iterable
+from typing import Any, Iterable, Mapping
 import streamlit as st
 
 def bump_version(key: str) -> int:
@@ -8,6 +8,12 @@ def bump_version(key: str) -> int:
     st.session_state[key] = int(st.session_state.get(key, 0)) + 1
     return st.session_state[key]
 
+def ensure_defaults(defaults: Mapping[str, Any]) -> None:
+    """Seed missing session keys in one pass; existing values are left untouched."""
+    ss = st.session_state
+    for k, v in defaults.items():
+        ss.setdefault(k, v)
+
 def clear_keys(keys: Iterable[str]) -> None:
     """Safely clear multiple keys if they exist."""
     for k in keys: